@@ -0,0 +1,87 @@
+# bench_cll_reverse.py
+"""
+Compares CircularLinkedList.reverse against the old rebuild-based reversal.
+
+Run from the project root:
+    python benchmarks/bench_cll_reverse.py
+    python benchmarks/bench_cll_reverse.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import CLL_Node, CircularLinkedList
+
+
+def rebuild_reverse_walking(cll):
+    """The original reverse: copy the values, then re-append each one by walking the ring."""
+    if not cll.head or cll.head.next == cll.head:
+        return
+    temp_list = cll.to_list()
+    temp_list.reverse()
+    cll.head = None
+    for data in temp_list:
+        new_node = CLL_Node(data)
+        if not cll.head:
+            cll.head = new_node
+            new_node.next = cll.head
+        else:
+            temp = cll.head
+            while temp.next != cll.head:
+                temp = temp.next
+            temp.next = new_node
+            new_node.next = cll.head
+    cll.tail = new_node
+
+
+def rebuild_reverse(cll):
+    """The original copy-and-rebuild reverse, but with the O(1) add_node."""
+    if not cll.head or cll.head.next == cll.head:
+        return
+    temp_list = cll.to_list()
+    temp_list.reverse()
+    cll.head = None
+    cll.tail = None
+    cll.length = 0
+    for data in temp_list:
+        cll.add_node(data)
+
+
+def build(n):
+    cll = CircularLinkedList(None)
+    for i in range(n):
+        cll.add_node(i)
+    return cll
+
+
+def time_reverse(reverse_fn, n):
+    cll = build(n)
+    start = time.perf_counter()
+    reverse_fn(cll)
+    elapsed = time.perf_counter() - start
+    assert cll.head.data == n - 1 and cll.tail.data == 0 and cll.tail.next is cll.head
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--walking-max", type=int, default=10_000,
+                        help="Largest size to run the quadratic ring-walking rebuild at (default: 10000).")
+    args = parser.parse_args()
+
+    print(f"{'n':>10} | {'walking rebuild':>16} | {'rebuild':>10} | {'in-place':>10} | {'speedup':>8}")
+    print("-" * 68)
+    for n in args.sizes:
+        walking = f"{time_reverse(rebuild_reverse_walking, n):.4f}s" if n <= args.walking_max else "skipped"
+        rebuild = time_reverse(rebuild_reverse, n)
+        in_place = time_reverse(CircularLinkedList.reverse, n)
+        print(f"{n:>10} | {walking:>16} | {rebuild:>9.4f}s | {in_place:>9.4f}s | {rebuild / in_place:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
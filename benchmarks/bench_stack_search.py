@@ -0,0 +1,58 @@
+# bench_stack_search.py
+"""
+Compares the indexed Stack.search against the old reverse-copy-and-index search.
+
+Run from the project root:
+    python benchmarks/bench_stack_search.py
+    python benchmarks/bench_stack_search.py --capacities 10 10000 1000000 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import Stack
+
+
+def legacy_search(stack, item):
+    """The original search: reverse-copy the items, then a linear index."""
+    try:
+        return stack._items[::-1].index(item) + 1
+    except ValueError:
+        return None
+
+
+def build(capacity):
+    stack = Stack(capacity=capacity)
+    for i in range(capacity):
+        stack.push(i)
+    return stack
+
+
+def per_call(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[10, 10_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=10, help="Timing runs per case; the fastest is reported (default: 10).")
+    args = parser.parse_args()
+
+    print(f"{'capacity':>10} | {'case':>7} | {'legacy':>12} | {'indexed':>12} | {'speedup':>9}")
+    print("-" * 62)
+    for capacity in args.capacities:
+        stack = build(capacity)
+        # The bottom item is the worst case for a top-down scan; -1 is never pushed.
+        for case, item in (("bottom", 0), ("missing", -1)):
+            assert legacy_search(stack, item) == stack.search(item)
+            legacy = per_call(lambda: legacy_search(stack, item), args.repeat)
+            indexed = per_call(lambda: stack.search(item), args.repeat)
+            print(f"{capacity:>10} | {case:>7} | {legacy * 1e6:>10.2f}us | {indexed * 1e6:>10.2f}us | {legacy / indexed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# bench_suite.py
+"""
+Micro-benchmarks for every list and stack operation, with regression checks.
+
+Each operation is timed at every size with timeit: the number of calls per
+run is calibrated until a run takes at least --min-time, the run is repeated
+--repeat times, and the fastest per-call time is kept. Results are written
+as JSON; with --baseline they are compared against an earlier results file
+and any operation slower by more than --threshold percent is flagged (exit
+status 1).
+
+Run from the project root:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --sizes 10 1000 --structures sll stack
+    python benchmarks/bench_suite.py --baseline baseline.json --threshold 15
+    python benchmarks/bench_suite.py --baseline baseline.json --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import LIST_ENGINES, STACK_BACKENDS
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+STRUCTURES = ("sll", "dll", "cll", "stack")
+MAX_NUMBER = 10_000
+
+
+def list_operations(linked_list, n):
+    """
+    (name, callable) pairs for one linked list holding 0..n-1.
+
+    They all share the list, so the ones that leave it unchanged come first
+    and reverse flips it. append and prepend come last: each grows the list
+    by one node per call, up to about 61k nodes with time_operation's
+    calibration and 5 repeats of MAX_NUMBER calls. Both are O(1) at any
+    length, and undoing an append would mean an O(n) tail delete on the
+    singly list, so the growth is left in place.
+    """
+    last = n - 1
+
+    def delete_last():
+        linked_list.delete_node(last)
+        linked_list.add_node(last)
+
+    return [
+        ("find_last", lambda: linked_list.find(last)),
+        ("find_missing", lambda: linked_list.contains(-1)),
+        ("delete_missing", lambda: linked_list.delete_node(-1)),
+        ("delete_last", delete_last),  # delete the tail value, then append it back
+        ("to_list", linked_list.to_list),
+        ("reverse", linked_list.reverse),
+        ("append", lambda: linked_list.add_node(-2)),
+        ("prepend", lambda: linked_list.prepend_node(-2)),
+    ]
+
+
+def stack_operations(stack, n):
+    """(name, callable) pairs for one stack holding 0..n-1 with room for one more item."""
+    def push_pop():
+        stack.push(n)
+        stack.pop()
+
+    return [
+        ("push_pop", push_pop),
+        ("peek", stack.peek),
+        ("search_bottom", lambda: stack.search(0)),
+        ("search_missing", lambda: stack.search(-1)),
+    ]
+
+
+def build(structure, n, engine, stack_backend):
+    """Returns (model, operations) for one structure holding 0..n-1."""
+    if structure == "stack":
+        stack = STACK_BACKENDS[stack_backend](capacity=n + 1)
+        for i in range(n):
+            stack.push(i)
+        return stack, stack_operations(stack, n)
+    list_class = LIST_ENGINES[engine][STRUCTURES.index(structure)]
+    linked_list = list_class(None)
+    linked_list.extend(range(n))
+    return linked_list, list_operations(linked_list, n)
+
+
+def time_operation(fn, repeat, min_time):
+    """Returns (fastest, median) seconds per call and the calls per run."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while number < MAX_NUMBER and timer.timeit(number) < min_time:
+        number *= 10
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return min(per_call), statistics.median(per_call), number
+
+
+def run_suite(sizes, structures, engine, stack_backend, repeat, min_time):
+    results = []
+    for structure in structures:
+        for n in sizes:
+            for name, fn in build(structure, n, engine, stack_backend)[1]:
+                best, median, number = time_operation(fn, repeat, min_time)
+                results.append({"name": f"{structure}.{name}", "n": n, "seconds": best,
+                                "median": median, "number": number, "repeat": repeat})
+                print(f"{structure + '.' + name:>20} | {n:>9} | {format_time(best):>10} | {number:>6} calls")
+    return results
+
+
+def compare(baseline, results, threshold):
+    """Returns (name, n, baseline seconds, seconds, % change, regressed) for every result also in the baseline."""
+    previous = {(r["name"], r["n"]): r["seconds"] for r in baseline}
+    rows = []
+    for r in results:
+        old = previous.get((r["name"], r["n"]))
+        if old is None:
+            continue
+        change = (r["seconds"] - old) / old * 100
+        rows.append((r["name"], r["n"], old, r["seconds"], change, change > threshold))
+    return rows
+
+
+def format_time(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.3f}us"
+    return f"{seconds * 1e9:.1f}ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES))
+    parser.add_argument("--engine", choices=sorted(LIST_ENGINES), default="nodes")
+    parser.add_argument("--stack-backend", choices=sorted(STACK_BACKENDS), default="list")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per operation; the fastest is kept (default: 5).")
+    parser.add_argument("--min-time", type=float, default=0.02,
+                        help="Calibrate calls per run until a run takes this many seconds (default: 0.02).")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON results.")
+    parser.add_argument("--baseline", help="Earlier results file to compare against.")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Flag operations more than this many percent slower than the baseline (default: 10).")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline.")
+    args = parser.parse_args()
+
+    print(f"{'operation':>20} | {'n':>9} | {'per call':>10} |")
+    print("-" * 56)
+    results = run_suite(args.sizes, args.structures, args.engine, args.stack_backend, args.repeat, args.min_time)
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "engine": args.engine,
+            "stack_backend": args.stack_backend,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    status = 0
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(baseline, results, args.threshold)
+        regressions = [row for row in rows if row[5]]
+        print(f"\n{'operation':>20} | {'n':>9} | {'baseline':>10} | {'now':>10} | {'change':>8}")
+        print("-" * 70)
+        for name, n, old, new, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:>20} | {n:>9} | {format_time(old):>10} | {format_time(new):>10} | {change:>+7.1f}%{flag}")
+        print(f"\n{len(regressions)} of {len(rows)} operations regressed by more than {args.threshold:g}%.")
+        status = 1 if regressions else 0
+    elif args.baseline and not args.save_baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create it.")
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+# check_complexity.py
+"""
+Checks that every list and stack operation still has its expected complexity.
+
+Each operation runs at geometrically growing sizes. Its cost at each size is
+either the operation count from the cost counters (--metric ops, the default
+and deterministic: pointer hops + comparisons + allocations) or the fastest
+timeit time per call (--metric time). The costs are fitted to a + b*f(n) for
+f in O(1), O(n), O(n log n) and O(n^2); the class with the smallest relative
+error wins, and near-ties go to the simpler class. Any operation whose fitted
+class differs from the expected one makes the script exit with status 1.
+
+Timings are too noisy for that fit: cache misses make long walks look
+slightly superlinear. With --metric time the class comes from the slope of
+log(cost) against log(n) instead, and O(n) and O(n log n) are not told apart.
+
+The stack operations are always timed. A stack has no nodes, and push, pop
+and peek compare no keys, so their operation count is 0 whatever they cost.
+
+Run from the project root:
+    python benchmarks/check_complexity.py
+    python benchmarks/check_complexity.py --engine indexed --stack-backend array
+    python benchmarks/check_complexity.py --metric time --engine pool
+"""
+
+import argparse
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import LIST_ENGINES, STACK_BACKENDS, COUNTERS, CostStats, instrument, uninstrument
+from bench_suite import STRUCTURES, build, time_operation
+
+SIZES = [1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000]
+
+COMPLEXITIES = {
+    "O(1)": lambda n: 1.0,
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) * n,
+}
+TIE_TOLERANCE = 1.25 # A simpler class wins unless a later one fits this many times better
+# Upper log-log slope bounds for classifying timings
+SLOPE_CLASSES = ((0.35, "O(1)"), (1.5, "O(n)"), (math.inf, "O(n^2)"))
+
+# Expected class of every bench_suite operation, by engine and backend.
+LIST_EXPECTED = {
+    "find_last": "O(n)", "find_missing": "O(n)", "delete_missing": "O(n)", "delete_last": "O(n)",
+    "to_list": "O(n)", "reverse": "O(n)", "append": "O(1)", "prepend": "O(1)",
+}
+# The value index turns lookups and deletes into dict hits.
+INDEXED_EXPECTED = dict(LIST_EXPECTED, find_last="O(1)", find_missing="O(1)", delete_missing="O(1)", delete_last="O(1)")
+# The pooled doubly list reverses by swapping its next and prev buffers.
+POOLED_DLL_EXPECTED = dict(LIST_EXPECTED, reverse="O(1)")
+STACK_EXPECTED = {"push_pop": "O(1)", "peek": "O(1)", "search_bottom": "O(1)", "search_missing": "O(1)"}
+# ArrayStack scans its buffer instead of keeping a position index.
+ARRAY_STACK_EXPECTED = dict(STACK_EXPECTED, search_bottom="O(n)", search_missing="O(n)")
+
+
+def expected_classes(structure, engine, stack_backend):
+    if structure == "stack":
+        return ARRAY_STACK_EXPECTED if stack_backend == "array" else STACK_EXPECTED
+    if engine == "indexed":
+        return INDEXED_EXPECTED
+    if engine == "pool" and structure == "dll":
+        return POOLED_DLL_EXPECTED
+    return LIST_EXPECTED
+
+
+def count_operation(fn):
+    before = sum(COUNTERS.snapshot())
+    fn()
+    return sum(COUNTERS.snapshot()) - before
+
+
+def measure(sizes, structures, engine, stack_backend, metric, repeat, min_time):
+    """Returns {(structure, operation): (expected class, [cost per size], metric used)}."""
+    costs = {}
+    for structure in structures:
+        structure_metric = "time" if structure == "stack" else metric
+        for n in sizes:
+            model, operations = build(structure, n, engine, stack_backend)
+            expected = expected_classes(structure, engine, stack_backend)
+            if structure_metric == "ops":
+                instrument(model, CostStats())
+            for name, fn in operations:
+                if structure_metric == "ops":
+                    cost = count_operation(fn)
+                else:
+                    cost = time_operation(fn, repeat, min_time)[0]
+                costs.setdefault((structure, name), (expected[name], [], structure_metric))[1].append(cost)
+            if structure_metric == "ops":
+                uninstrument(model)
+    return costs
+
+
+def fit(sizes, costs):
+    """
+    Fits costs to a + b*f(n) for every class, weighting each point by 1/cost^2
+    so the error is relative. Returns (best class, {class: RMS relative error}).
+    """
+    weights = [1.0 / max(cost, 1e-12) ** 2 for cost in costs]
+    errors = {}
+    for name, f in COMPLEXITIES.items():
+        xs = [f(n) for n in sizes]
+        sw = sum(weights)
+        sx = sum(w * x for w, x in zip(weights, xs))
+        sy = sum(w * y for w, y in zip(weights, costs))
+        sxx = sum(w * x * x for w, x in zip(weights, xs))
+        sxy = sum(w * x * y for w, x, y in zip(weights, xs, costs))
+        denominator = sw * sxx - sx * sx
+        b = (sw * sxy - sx * sy) / denominator if denominator > 1e-12 * sw * sxx else 0.0
+        b = max(b, 0.0) # costs never shrink as n grows
+        a = (sy - b * sx) / sw
+        residual = sum(w * (y - a - b * x) ** 2 for w, x, y in zip(weights, xs, costs))
+        errors[name] = math.sqrt(residual / len(sizes))
+    best = "O(1)"
+    for name in COMPLEXITIES:
+        if errors[name] * TIE_TOLERANCE < errors[best]:
+            best = name
+    return best, errors
+
+
+def slope_class(sizes, costs):
+    """Classifies timings by the least-squares slope of log(cost) against log(n); returns (class, slope)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(cost, 1e-12)) for cost in costs]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+             / sum((x - mean_x) ** 2 for x in xs))
+    for bound, name in SLOPE_CLASSES:
+        if slope < bound:
+            return name, slope
+
+
+def format_cost(cost, metric):
+    return f"{cost:.0f}" if metric == "ops" else f"{cost * 1e6:.2f}us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES))
+    parser.add_argument("--engine", choices=sorted(LIST_ENGINES), default="nodes")
+    parser.add_argument("--stack-backend", choices=sorted(STACK_BACKENDS), default="list")
+    parser.add_argument("--metric", choices=("ops", "time"), default="ops",
+                        help="Fit operation counts (default) or wall-clock time per call.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per point with --metric time (default: 5).")
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="Calibrate calls per timing run up to this many seconds (default: 0.01).")
+    args = parser.parse_args()
+    if args.metric == "ops" and args.engine == "pool":
+        parser.error("the pooled lists link by array index, so their hops are not counted; use --metric time")
+    if len(args.sizes) < 3:
+        parser.error("at least three sizes are needed to tell the classes apart")
+    sizes = sorted(args.sizes)
+
+    costs = measure(sizes, args.structures, args.engine, args.stack_backend, args.metric, args.repeat, args.min_time)
+    print(f"{'operation':>20} | {'expected':>10} | {'fitted':>10} | {f'n={sizes[0]}':>12} | {f'n={sizes[-1]}':>12} |")
+    print("-" * 82)
+    mismatches = []
+    for (structure, name), (expected, series, metric) in costs.items():
+        if metric == "ops":
+            fitted, _ = fit(sizes, series)
+        else:
+            fitted, _ = slope_class(sizes, series)
+            if expected == "O(n log n)":
+                expected = "O(n)"
+        flag = "" if fitted == expected else "  MISMATCH"
+        if flag:
+            mismatches.append(f"{structure}.{name}")
+        print(f"{structure + '.' + name:>20} | {expected:>10} | {fitted:>10} | "
+              f"{format_cost(series[0], metric):>12} | {format_cost(series[-1], metric):>12} |{flag}")
+
+    if mismatches:
+        print(f"\nFAIL: {len(mismatches)} operation(s) no longer have their expected complexity: {', '.join(mismatches)}")
+        return 1
+    print(f"\nOK: all {len(costs)} operations match their expected complexity.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# cli.py
+"""
+Headless command line for the data models (no tkinter, PIL or pygame).
+
+    python cli.py run workload.txt [--engine pool] [--stack-backend array] [--capacity 1000000] [--show]
+    python cli.py run -            # read the workload from stdin
+    python cli.py import-time [--budget-ms 50] [--runs 5]
+
+See core.Workbench for the workload line format.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import core
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Run in a fresh interpreter so the measurement is a cold `import core`.
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import core\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed)\n"
+    "print(','.join(m for m in core.GUI_MODULES if m in sys.modules))\n"
+)
+
+
+def measure_import_time(runs=5):
+    """Returns (fastest cold `import core` in seconds, GUI modules it loaded)."""
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout.splitlines()
+        timings.append(float(output[0]))
+        loaded.update(m for m in output[1].split(",") if m)
+    return min(timings), sorted(loaded)
+
+
+def cmd_run(args):
+    if args.workload == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            with open(args.workload) as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    try:
+        workbench, results, elapsed = core.run_workload(lines, args.engine, args.stack_backend, args.capacity)
+    except (ValueError, core.StackOverflowError, core.StackUnderflowError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for line_no, result in results:
+        print(f"line {line_no}: {result}")
+    for name, linked_list in workbench.lists.items():
+        print(f"{name}: {len(linked_list)} nodes" + (f" {linked_list.to_list()}" if args.show else ""))
+    print(f"stack: {len(workbench.stack)} / {workbench.stack.capacity}" + (f" {workbench.stack.to_list()}" if args.show else ""))
+    print(f"Ran {len(lines)} lines in {elapsed:.4f}s.")
+    return 0
+
+
+def cmd_import_time(args):
+    fastest, loaded = measure_import_time(args.runs)
+    print(f"Cold 'import core': {fastest * 1000:.1f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    if loaded:
+        print(f"FAIL: importing core loaded GUI modules: {', '.join(loaded)}")
+        return 1
+    if fastest * 1000 > args.budget_ms:
+        print("FAIL: over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run a scripted workload file.")
+    run_parser.add_argument("workload", help="Workload file, or - for stdin.")
+    run_parser.add_argument("--engine", choices=sorted(core.LIST_ENGINES), default="nodes")
+    run_parser.add_argument("--stack-backend", choices=sorted(core.STACK_BACKENDS), default="aggregate")
+    run_parser.add_argument("--capacity", type=int, default=10, help="Stack capacity (default: 10).")
+    run_parser.add_argument("--show", action="store_true", help="Print the final contents of every model.")
+    run_parser.set_defaults(handler=cmd_run)
+
+    import_parser = subparsers.add_parser("import-time", help="Check the cold import time of the headless core.")
+    import_parser.add_argument("--budget-ms", type=float, default=50.0, help="Fail above this many ms (default: 50).")
+    import_parser.add_argument("--runs", type=int, default=5)
+    import_parser.set_defaults(handler=cmd_import_time)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# core.py
+"""
+Headless entry point to every data model in the project.
+
+Nothing imported here pulls in tkinter, PIL or pygame, so batch workers,
+benchmarks and the CLI (cli.py) can `import core` without paying for the
+GUI stack. The GUI modules import their models from here as well.
+"""
+
+import time
+from functools import partial
+
+from linkedlist_models import (NodeIndex, link_chain, SLL_Node, SinglyLinkedList,
+                               DLL_Node, DoublyLinkedList, CLL_Node, CircularLinkedList)
+from list_pool import NIL, VALUE_RANGE, NodePool, PooledSinglyLinkedList, PooledDoublyLinkedList, PooledCircularLinkedList
+from persistent_list import PSLL_Node, PersistentSinglyLinkedList
+from stack_models import StackOverflowError, StackUnderflowError, Stack, AggregateStack, ArrayStack, STACK_BACKENDS
+from journal import OperationJournal
+from instrumentation import COUNTERS, CostStats, OperationCost, instrument, uninstrument, is_instrumented
+from latency import PHASES, LatencyHistogram, LatencyRecorder
+from log_buffer import LogBuffer
+
+# Storage engines selectable through MainApp(list_engine=...)
+LIST_ENGINES = {
+    "nodes": (SinglyLinkedList, DoublyLinkedList, CircularLinkedList),
+    "indexed": tuple(partial(cls, indexed=True) for cls in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList)),
+    "pool": (PooledSinglyLinkedList, PooledDoublyLinkedList, PooledCircularLinkedList),
+}
+
+# Modules that must never be loaded by `import core`
+GUI_MODULES = ("tkinter", "PIL", "pygame")
+
+# --- Scripted Workloads ---
+class Workbench:
+    """
+    The three linked lists and a stack, driven by workload lines such as:
+
+        sll append 1 2 3      # several values use extend/prepend_all/delete_many
+        dll delete 2
+        cll reverse
+        stack push 5 6
+        stack search 5
+
+    Lists support append, prepend, delete, reverse, find and len. The stack
+    supports push, pop, peek, search and len, plus min, max and sum when the
+    backend is "aggregate". Blank lines and "#" comments are ignored.
+    """
+    LIST_OPS = ("append", "prepend", "delete", "reverse", "find", "len")
+    STACK_OPS = ("push", "pop", "peek", "search", "len", "min", "max", "sum")
+
+    def __init__(self, list_engine="nodes", stack_backend="aggregate", capacity=10):
+        sll_class, dll_class, cll_class = LIST_ENGINES[list_engine]
+        self.lists = {"sll": sll_class(None), "dll": dll_class(None), "cll": cll_class(None)}
+        self.stack = STACK_BACKENDS[stack_backend](capacity=capacity)
+
+    def run(self, lines):
+        """Runs every workload line; returns the results of the query operations as (line number, result) pairs."""
+        results = []
+        for line_no, line in enumerate(lines, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                raise ValueError(f"Line {line_no}: expected '<target> <operation> [values...]': {line!r}")
+            target, op, args = parts[0], parts[1], parts[2:]
+            try:
+                values = [int(v) for v in args]
+            except ValueError:
+                raise ValueError(f"Line {line_no}: values must be integers: {line!r}")
+            try:
+                if target in self.lists:
+                    result = self._run_list_op(self.lists[target], op, values, line_no)
+                elif target == "stack":
+                    result = self._run_stack_op(op, values, line_no)
+                else:
+                    raise ValueError(f"Line {line_no}: unknown target {target!r} (expected sll, dll, cll or stack).")
+            except OverflowError:
+                # The pooled lists and the array stack hold fixed-width ints
+                raise ValueError(f"Line {line_no}: value too large for the {target} storage: {line!r}")
+            if result is not None:
+                results.append((line_no, result))
+        return results
+
+    def _run_list_op(self, linked_list, op, values, line_no):
+        if op not in self.LIST_OPS:
+            raise ValueError(f"Line {line_no}: unknown list operation {op!r}.")
+        if op == "append":
+            linked_list.extend(values)
+        elif op == "prepend":
+            linked_list.prepend_all(values)
+        elif op == "delete":
+            linked_list.delete_many(values)
+        elif op == "reverse":
+            linked_list.reverse()
+        elif op == "find":
+            return [linked_list.contains(v) for v in values]
+        elif op == "len":
+            return len(linked_list)
+        return None
+
+    def _run_stack_op(self, op, values, line_no):
+        if op not in self.STACK_OPS:
+            raise ValueError(f"Line {line_no}: unknown stack operation {op!r}.")
+        stack = self.stack
+        if op == "push":
+            for value in values:
+                stack.push(value)
+        elif op == "pop":
+            return [stack.pop() for _ in range(values[0] if values else 1)]
+        elif op == "peek":
+            return stack.peek()
+        elif op == "search":
+            return [stack.search(v) for v in values]
+        elif op == "len":
+            return len(stack)
+        elif not hasattr(stack, "minimum"):
+            raise ValueError(f"Line {line_no}: {op!r} needs the aggregate stack backend.")
+        elif op == "min":
+            return stack.minimum()
+        elif op == "max":
+            return stack.maximum()
+        elif op == "sum":
+            return stack.total()
+        return None
+
+def run_workload(lines, list_engine="nodes", stack_backend="aggregate", capacity=10):
+    """Runs workload lines on a fresh Workbench; returns (workbench, results, elapsed seconds)."""
+    workbench = Workbench(list_engine, stack_backend, capacity)
+    start = time.perf_counter()
+    results = workbench.run(lines)
+    return workbench, results, time.perf_counter() - start
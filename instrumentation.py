@@ -0,0 +1,191 @@
+# instrumentation.py
+# GUI-free cost counters for the list and stack models.
+
+from collections import Counter, deque, namedtuple
+from contextlib import contextmanager
+from functools import wraps
+
+from linkedlist_models import SLL_Node, DLL_Node, CLL_Node
+
+OperationCost = namedtuple("OperationCost", "name hops comparisons allocations")
+
+class CostCounters:
+    """Running totals shared by every instrumented model."""
+    __slots__ = ("hops", "comparisons", "allocations")
+    def __init__(self):
+        self.hops = 0
+        self.comparisons = 0
+        self.allocations = 0
+    def snapshot(self):
+        return (self.hops, self.comparisons, self.allocations)
+
+COUNTERS = CostCounters()
+
+class CountedKey:
+    """Wraps a search key so every == / != against it is counted, including dict lookups."""
+    __slots__ = ("value",)
+    def __init__(self, value):
+        self.value = value
+    def __eq__(self, other):
+        COUNTERS.comparisons += 1
+        return self.value == other
+    def __ne__(self, other):
+        COUNTERS.comparisons += 1
+        return self.value != other
+    def __hash__(self):
+        return hash(self.value)
+    def __repr__(self):
+        return repr(self.value)
+    def __str__(self):
+        return str(self.value)
+
+class CostStats:
+    """
+    Queryable per-operation costs. Each outermost measured call records an
+    OperationCost; calls made inside it (e.g. contains -> find) are folded
+    into the outer one.
+    """
+    def __init__(self, history=200):
+        self.depth = 0
+        self.calls = Counter()
+        self.totals = {}
+        self.recent = deque(maxlen=history)
+    @contextmanager
+    def measure(self, name):
+        if self.depth:
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+            return
+        self.depth = 1
+        before = COUNTERS.snapshot()
+        try:
+            yield
+        finally:
+            self.depth = 0
+            after = COUNTERS.snapshot()
+            self.record(OperationCost(name, *(a - b for a, b in zip(after, before))))
+    def record(self, cost):
+        self.recent.append(cost)
+        self.calls[cost.name] += 1
+        hops, comparisons, allocations = self.totals.get(cost.name, (0, 0, 0))
+        self.totals[cost.name] = (hops + cost.hops, comparisons + cost.comparisons, allocations + cost.allocations)
+    def last(self):
+        return self.recent[-1] if self.recent else None
+    def summary(self):
+        """Returns {operation: {"calls", "hops", "comparisons", "allocations"}} with the summed costs."""
+        return {name: dict(zip(("calls", "hops", "comparisons", "allocations"), (self.calls[name],) + totals))
+                for name, totals in self.totals.items()}
+    def reset(self):
+        self.calls.clear()
+        self.totals.clear()
+        self.recent.clear()
+    @staticmethod
+    def describe(cost):
+        return (f"{cost.name}: {cost.hops} pointer hop(s), {cost.comparisons} comparison(s), "
+                f"{cost.allocations} allocation(s)")
+
+# --- Node counters (installed only while at least one model is instrumented) ---
+_LINKS = {SLL_Node: ("next",), DLL_Node: ("next", "prev"), CLL_Node: ("next",)}
+_original_inits = {}
+_instrumented = 0
+
+def _link_property(name):
+    def get_link(node):
+        COUNTERS.hops += 1
+        return node.__dict__[name]
+    def set_link(node, value):
+        node.__dict__[name] = value
+    return property(get_link, set_link)
+
+def _counting_init(init):
+    @wraps(init)
+    def __init__(self, *args, **kwargs):
+        COUNTERS.allocations += 1
+        init(self, *args, **kwargs)
+    return __init__
+
+def _install_node_counters():
+    for node_class, links in _LINKS.items():
+        _original_inits[node_class] = node_class.__init__
+        node_class.__init__ = _counting_init(node_class.__init__)
+        for name in links:
+            setattr(node_class, name, _link_property(name))
+
+def _remove_node_counters():
+    # Nodes keep their links in __dict__, so dropping the properties restores plain attribute access.
+    for node_class, links in _LINKS.items():
+        node_class.__init__ = _original_inits.pop(node_class)
+        for name in links:
+            delattr(node_class, name)
+
+# --- Model instrumentation ---
+MEASURED = ("add_node", "prepend_node", "find", "contains", "__contains__", "delete_node", "_locate",
+            "extend", "prepend_all", "delete_many", "reverse", "to_list",
+            "push", "pop", "peek", "search", "count")
+KEYED = ("find", "contains", "__contains__", "delete_node", "_locate", "search", "count")
+_counting_classes = {}
+
+def _wrap_key(key):
+    return key if isinstance(key, CountedKey) else CountedKey(key)
+
+def _measured(name, method):
+    if name in KEYED:
+        @wraps(method)
+        def wrapper(self, key, *args):
+            with self._cost_stats.measure(name):
+                return method(self, _wrap_key(key), *args)
+    elif name == "delete_many":
+        @wraps(method)
+        def wrapper(self, keys, *args):
+            with self._cost_stats.measure(name):
+                return method(self, [_wrap_key(key) for key in keys], *args)
+    else:
+        @wraps(method)
+        def wrapper(self, *args):
+            with self._cost_stats.measure(name):
+                return method(self, *args)
+    return wrapper
+
+def _counting_class(model_class):
+    counting_class = _counting_classes.get(model_class)
+    if counting_class is None:
+        namespace = {name: _measured(name, getattr(model_class, name))
+                     for name in MEASURED if hasattr(model_class, name)}
+        counting_class = type("Counting" + model_class.__name__, (model_class,), namespace)
+        _counting_classes[model_class] = counting_class
+    return counting_class
+
+def is_instrumented(model):
+    return "_cost_stats" in vars(model)
+
+def instrument(model, stats):
+    """
+    Switches `model` to a counting subclass that records each operation in
+    `stats`. Pointer hops and allocations are counted for the node-based
+    lists; comparisons for every model. O(1): the nodes are not touched.
+    """
+    global _instrumented
+    if is_instrumented(model):
+        model._cost_stats = stats
+        return model
+    if not _instrumented:
+        _install_node_counters()
+    _instrumented += 1
+    model._cost_stats = stats
+    model.__class__ = _counting_class(type(model))
+    return model
+
+def uninstrument(model):
+    """Restores the plain class; with no instrumented models left, the node counters are removed too."""
+    global _instrumented
+    if not is_instrumented(model):
+        return model
+    model.__class__ = type(model).__bases__[0]
+    del model._cost_stats
+    _instrumented -= 1
+    if not _instrumented:
+        _remove_node_counters()
+    return model
@@ -0,0 +1,224 @@
+# journal.py
+
+from collections import deque
+
+class OperationJournal:
+    """
+    Undo/redo history for the linked list models and Stack.
+
+    Each mutation goes through the journal, which performs it and records
+    what is needed to invert it. List entries keep the node and its
+    predecessor, so undoing or redoing an append, prepend or delete is a
+    single O(1) relink. A reverse is undone by reversing again (O(n)).
+    Only the newest `max_history` steps are kept; older ones are evicted.
+
+    Persistent lists already keep their versions, so for them an entry just
+    holds the version ids before and after, and undo/redo is a checkout.
+    Entries whose version the list has since dropped are skipped and
+    removed; the other targets' history is kept.
+    Targets with neither (e.g. the pooled lists) are still mutated, but
+    those operations are not recorded; see can_record.
+    """
+    def __init__(self, max_history=1000):
+        self.undo_stack = deque(maxlen=max_history)
+        self.redo_stack = []
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def forget(self, target):
+        """Drops every entry that touches `target` (e.g. after it has been replaced)."""
+        def touches(entry):
+            if entry[0] == "group":
+                return any(step[1] is target for step in entry[1])
+            return entry[1] is target
+        self.undo_stack = deque((e for e in self.undo_stack if not touches(e)), maxlen=self.undo_stack.maxlen)
+        self.redo_stack = [e for e in self.redo_stack if not touches(e)]
+
+    def _forget_dropped(self, target):
+        """Drops `target`'s entries that would check out a version it no longer keeps."""
+        def dropped(entry):
+            return entry[0] == "checkout" and entry[1] is target and not target.has_version(entry[2])
+        self.undo_stack = deque((e for e in self.undo_stack if not dropped(e)), maxlen=self.undo_stack.maxlen)
+
+    def _record(self, entry):
+        self.undo_stack.append(entry)
+        self.redo_stack.clear()
+
+    @staticmethod
+    def _is_linkable(target):
+        return hasattr(target, "_link_after")
+
+    @staticmethod
+    def _is_versioned(target):
+        return hasattr(target, "checkout")
+
+    @classmethod
+    def can_record(cls, target):
+        """True if operations on `target` are recorded, i.e. can be undone."""
+        return cls._is_versioned(target) or cls._is_linkable(target)
+
+    def _record_version(self, target, method, *args):
+        """Runs a mutation on a persistent list and records the version change."""
+        before = target.current
+        result = method(*args)
+        if target.current != before:
+            self._record(("checkout", target, before, target.current))
+        return result
+
+    # --- Linked list operations ---
+    def append(self, target, data):
+        if self._is_versioned(target):
+            return self._record_version(target, target.add_node, data)
+        if not self._is_linkable(target):
+            return target.add_node(data)
+        prev = target.tail
+        target.add_node(data)
+        self._record(("link", target, prev, target.tail))
+
+    def prepend(self, target, data):
+        if self._is_versioned(target):
+            return self._record_version(target, target.prepend_node, data)
+        if not self._is_linkable(target):
+            return target.prepend_node(data)
+        target.prepend_node(data)
+        self._record(("link", target, None, target.head))
+
+    def delete(self, target, key):
+        """Deletes the first `key` from `target`; returns True if a node was removed."""
+        if self._is_versioned(target):
+            return self._record_version(target, target.delete_node, key)
+        if not self._is_linkable(target):
+            return target.delete_node(key)
+        found = target._locate(key)
+        if not found:
+            return False
+        prev, node = found
+        target._unlink(prev, node)
+        self._record(("unlink", target, prev, node))
+        return True
+
+    def reverse(self, target):
+        if self._is_versioned(target):
+            return self._record_version(target, target.reverse)
+        target.reverse()
+        if self._is_linkable(target):
+            self._record(("reverse", target, None, None))
+
+    def extend(self, target, values):
+        """Appends values with the one-pass extend, recorded as a single undo step."""
+        if self._is_versioned(target):
+            return self._record_version(target, target.extend, values)
+        if not self._is_linkable(target):
+            return target.extend(values)
+        prev = target.tail
+        count = target.extend(values)
+        node = prev.next if prev else target.head
+        steps = []
+        for _ in range(count):
+            steps.append(("link", target, prev, node))
+            prev, node = node, node.next
+        if steps:
+            self._record(("group", steps, None, None))
+        return count
+
+    def prepend_all(self, target, values):
+        """Prepends values with the one-pass prepend_all, recorded as a single undo step."""
+        if self._is_versioned(target):
+            return self._record_version(target, target.prepend_all, values)
+        if not self._is_linkable(target):
+            return target.prepend_all(values)
+        count = target.prepend_all(values)
+        node = target.head
+        steps = []
+        for _ in range(count):
+            steps.append(("link", target, None, node))
+            node = node.next
+        if steps:
+            # Recorded as head links from the last value back to the first,
+            # so a redo rebuilds the run one O(1) head insert at a time.
+            steps.reverse()
+            self._record(("group", steps, None, None))
+        return count
+
+    def delete_many(self, target, keys):
+        """Deletes the first occurrence of each key, recorded as a single undo step; returns how many were removed."""
+        if self._is_versioned(target):
+            return self._record_version(target, target.delete_many, keys)
+        if not self._is_linkable(target):
+            return target.delete_many(keys)
+        steps = []
+        if target.index is None:
+            # One pass over the list, recording each node as it is unlinked
+            target.delete_many(keys, lambda prev, node: steps.append(("unlink", target, prev, node)))
+        else:
+            # The index finds each key without a walk
+            for key in keys:
+                found = target._locate(key)
+                if found:
+                    target._unlink(*found)
+                    steps.append(("unlink", target) + found)
+        if steps:
+            self._record(("group", steps, None, None))
+        return len(steps)
+
+    # --- Stack operations ---
+    def push(self, stack, item):
+        stack.push(item)
+        self._record(("push", stack, item, None))
+
+    def pop(self, stack):
+        item = stack.pop()
+        self._record(("pop", stack, item, None))
+        return item
+
+    # --- Undo / Redo ---
+    def undo(self, steps=1):
+        """Undoes up to `steps` operations; returns how many were undone."""
+        done = 0
+        while done < steps and self.undo_stack:
+            entry = self.undo_stack[-1]
+            if entry[0] == "checkout" and not entry[1].has_version(entry[2]):
+                self._forget_dropped(entry[1])
+                continue
+            self.undo_stack.pop()
+            self._apply(entry, inverse=True)
+            self.redo_stack.append(entry)
+            done += 1
+        return done
+
+    def redo(self, steps=1):
+        """Redoes up to `steps` undone operations; returns how many were redone."""
+        done = 0
+        while done < steps and self.redo_stack:
+            entry = self.redo_stack.pop()
+            self._apply(entry, inverse=False)
+            self.undo_stack.append(entry)
+            done += 1
+        return done
+
+    def _apply(self, entry, inverse):
+        kind, target, a, b = entry
+        if kind == "group":
+            for step in (reversed(target) if inverse else target):
+                self._apply(step, inverse)
+        elif kind == "reverse":
+            target.reverse()
+        elif kind == "checkout":
+            target.checkout(a if inverse else b)
+        elif kind in ("link", "unlink"):
+            if (kind == "link") != inverse:
+                target._link_after(a, b)
+            else:
+                target._unlink(a, b)
+        elif (kind == "push") != inverse:
+            target.push(a)
+        else:
+            target.pop()
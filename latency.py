@@ -0,0 +1,100 @@
+# latency.py
+# GUI-free latency histograms for the page actions.
+
+import json
+import math
+import time
+from collections import Counter
+
+PHASES = ("model", "render", "idle")
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram: each bucket is GROWTH times wider than the one
+    before, so memory stays small for any number of samples and percentiles
+    are accurate to within one bucket (5%).
+    """
+    GROWTH = 1.05
+    MIN_SECONDS = 1e-6 # Everything faster lands in bucket 0
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    def add(self, seconds):
+        index = 0
+        if seconds > self.MIN_SECONDS:
+            index = math.ceil(math.log(seconds / self.MIN_SECONDS) / math.log(self.GROWTH))
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+    def upper_bound(self, index):
+        return self.MIN_SECONDS * self.GROWTH ** index
+    def percentile(self, p):
+        """Returns the upper bound of the bucket holding the p-th percentile sample (0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": [[self.upper_bound(index), self.buckets[index]] for index in sorted(self.buckets)],
+        }
+
+class ActionTiming:
+    """Times the phases of one action; nothing is recorded until commit()."""
+    __slots__ = ("recorder", "action", "phases", "last")
+    def __init__(self, recorder, action):
+        self.recorder = recorder
+        self.action = action
+        self.phases = {}
+        self.last = time.perf_counter()
+    def lap(self, phase):
+        """Ends `phase`, which started when the previous one ended."""
+        now = time.perf_counter()
+        self.phases[phase] = now - self.last
+        self.last = now
+    def commit(self):
+        for phase, seconds in self.phases.items():
+            self.recorder.record(self.action, phase, seconds)
+
+class LatencyRecorder:
+    """Per-action, per-phase latency histograms."""
+    def __init__(self):
+        self.histograms = {} # action -> {phase: LatencyHistogram}
+    def start(self, action):
+        return ActionTiming(self, action)
+    def record(self, action, phase, seconds):
+        phases = self.histograms.setdefault(action, {})
+        histogram = phases.get(phase)
+        if histogram is None:
+            histogram = phases[phase] = LatencyHistogram()
+        histogram.add(seconds)
+    def percentiles(self, action):
+        """Returns {phase: (p50, p95, p99)} in seconds for one action."""
+        return {phase: (h.percentile(50), h.percentile(95), h.percentile(99))
+                for phase, h in self.histograms.get(action, {}).items()}
+    def reset(self):
+        self.histograms.clear()
+    def to_dict(self):
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "unit": "seconds",
+            "actions": {action: {phase: h.to_dict() for phase, h in phases.items()}
+                        for action, phases in self.histograms.items()},
+        }
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
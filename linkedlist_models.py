@@ -0,0 +1,745 @@
+# linkedlist_models.py
+# GUI-free linked list models; importable without tkinter, PIL or pygame.
+
+from collections import Counter, deque
+from itertools import islice
+
+# --- Linked List Classes (Data Models) ---
+class NodeIndex:
+    """
+    Maps each value to a deque of the nodes holding it, kept in head-to-tail
+    order. The first node in a bucket is the one a scan from head would hit,
+    so indexed lookups return the same node as the linear search.
+    """
+    def __init__(self):
+        self.buckets = {}
+    def add_first(self, node):
+        bucket = self.buckets.get(node.data)
+        if bucket is None:
+            self.buckets[node.data] = deque((node,))
+        else:
+            bucket.appendleft(node)
+    def add_last(self, node):
+        bucket = self.buckets.get(node.data)
+        if bucket is None:
+            self.buckets[node.data] = deque((node,))
+        else:
+            bucket.append(node)
+    def first(self, key):
+        bucket = self.buckets.get(key)
+        return bucket[0] if bucket else None
+    def count(self, key):
+        bucket = self.buckets.get(key)
+        return len(bucket) if bucket else 0
+    def remove(self, node):
+        bucket = self.buckets[node.data]
+        if bucket[0] is node:
+            bucket.popleft()
+        elif bucket[-1] is node:
+            bucket.pop()
+        else:
+            bucket.remove(node)
+        if not bucket:
+            del self.buckets[node.data]
+    def add_run(self, first, count, at_front=False):
+        """Indexes `count` nodes linked from `first`, placed at the front or back of the list."""
+        run = []
+        node = first
+        for _ in range(count):
+            run.append(node)
+            node = node.next
+        if at_front:
+            for node in reversed(run):
+                self.add_first(node)
+        else:
+            for node in run:
+                self.add_last(node)
+    def reverse(self):
+        for bucket in self.buckets.values():
+            bucket.reverse()
+
+def link_chain(node_class, iterable, doubly=False):
+    """Links a fresh node per value in one pass; returns (first, last, count)."""
+    first = last = None
+    count = 0
+    for data in iterable:
+        node = node_class(data)
+        if last:
+            last.next = node
+            if doubly:
+                node.prev = last
+        else:
+            first = node
+        last = node
+        count += 1
+    return first, last, count
+
+class SLL_Node:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+class SinglyLinkedList:
+    def __init__(self, app, indexed=False):
+        self.head = None
+        self.tail = None # Last node, kept so appends never walk the chain
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+        # Optional value -> nodes index, plus node -> predecessor map so an
+        # indexed delete can unlink without walking from head.
+        self.index = NodeIndex() if indexed else None
+        self.prev_of = {} if indexed else None
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) is not None
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.data
+            curr = curr.next
+    def __reversed__(self):
+        # No back links, so the values have to be collected first.
+        return reversed(self.to_list())
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, without copying the list."""
+        start = max(start, 0)
+        return islice(self, start, start + max(count, 0))
+    def add_node(self, data):
+        new_node = SLL_Node(data)
+        if self.index is not None:
+            self.index.add_last(new_node)
+            self.prev_of[new_node] = self.tail
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        new_node = SLL_Node(data)
+        if self.index is not None:
+            self.index.add_first(new_node)
+            self.prev_of[new_node] = None
+            if self.head:
+                self.prev_of[self.head] = new_node
+        new_node.next = self.head
+        self.head = new_node
+        if not self.tail:
+            self.tail = new_node
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first node holding `key`, or None."""
+        if self.index is not None:
+            return self.index.first(key)
+        curr = self.head
+        while curr and curr.data != key:
+            curr = curr.next
+        return curr
+    def contains(self, key):
+        return self.find(key) is not None
+    def delete_node(self, key):
+        found = self._locate(key)
+        if not found:
+            return False
+        self._unlink(*found)
+        return True
+    def _locate(self, key):
+        """Returns (predecessor, node) for the first node holding `key`, or None."""
+        if self.index is not None:
+            node = self.index.first(key)
+            return (self.prev_of[node], node) if node else None
+        prev = None
+        curr = self.head
+        while curr and curr.data != key:
+            prev = curr
+            curr = curr.next
+        return (prev, curr) if curr else None
+    def _link_after(self, prev, node):
+        """Links a detached `node` after `prev` (None for the head); the inverse of _unlink."""
+        at_tail = prev is not None and prev is self.tail
+        if prev:
+            node.next = prev.next
+            prev.next = node
+        else:
+            node.next = self.head
+            self.head = node
+        if not node.next:
+            self.tail = node
+        if self.index is not None:
+            # A mid-chain link only ever restores a node delete_node took
+            # out, and that node was the first one holding its value.
+            if at_tail:
+                self.index.add_last(node)
+            else:
+                self.index.add_first(node)
+            self.prev_of[node] = prev
+            if node.next:
+                self.prev_of[node.next] = node
+        self.length += 1
+        self.version += 1
+    def _unlink(self, prev, node):
+        """Removes `node`, whose predecessor is `prev` (None for the head)."""
+        if prev:
+            prev.next = node.next
+        else:
+            self.head = node.next
+        if node is self.tail:
+            self.tail = prev
+        if self.index is not None:
+            self.index.remove(node)
+            del self.prev_of[node]
+            if node.next:
+                self.prev_of[node.next] = prev
+        node.next = None
+        self.length -= 1
+        self.version += 1
+    @classmethod
+    def from_iterable(cls, app, iterable, **kwargs):
+        linked_list = cls(app, **kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = link_chain(SLL_Node, iterable)
+        if not count:
+            return 0
+        if self.index is not None:
+            self.index.add_run(first, count)
+            self._map_predecessors(first, count, self.tail)
+        if self.tail:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = link_chain(SLL_Node, iterable)
+        if not count:
+            return 0
+        if self.index is not None:
+            self.index.add_run(first, count, at_front=True)
+            self._map_predecessors(first, count, None)
+            if self.head:
+                self.prev_of[self.head] = last
+        last.next = self.head
+        self.head = first
+        if not self.tail:
+            self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys, on_unlink=None):
+        """
+        Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed.
+        on_unlink(prev, node) is called for each node unlinked by the pass, with prev as _locate reports it.
+        """
+        if self.index is not None:
+            return sum(1 for key in keys if self.delete_node(key))
+        pending = Counter(keys)
+        removed = 0
+        prev = None
+        curr = self.head
+        while curr and pending:
+            next_node = curr.next
+            if pending.get(curr.data):
+                pending[curr.data] -= 1
+                if not pending[curr.data]:
+                    del pending[curr.data]
+                if on_unlink is not None:
+                    on_unlink(prev, curr)
+                self._unlink(prev, curr)
+                removed += 1
+            else:
+                prev = curr
+            curr = next_node
+        return removed
+    def _map_predecessors(self, first, count, before):
+        """Records predecessors for `count` chained nodes, the first of which follows `before`."""
+        node = first
+        for _ in range(count):
+            self.prev_of[node] = before
+            before = node
+            node = node.next
+    def reverse(self):
+        prev = None
+        current = self.head
+        self.tail = current
+        prev_of = self.prev_of
+        while current:
+            next_node = current.next
+            current.next = prev
+            if prev_of is not None:
+                prev_of[current] = next_node
+            prev = current
+            current = next_node
+        self.head = prev
+        self.version += 1
+        if self.index is not None:
+            self.index.reverse()
+    def to_list(self):
+        nodes = []
+        curr = self.head
+        while curr:
+            nodes.append(curr.data)
+            curr = curr.next
+        return nodes
+
+class DLL_Node:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+class DoublyLinkedList:
+    def __init__(self, app, indexed=False):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+        self.index = NodeIndex() if indexed else None # Optional value -> nodes index
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) is not None
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.data
+            curr = curr.next
+    def __reversed__(self):
+        curr = self.tail
+        while curr:
+            yield curr.data
+            curr = curr.prev
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, walking in from the nearer end."""
+        start = max(start, 0)
+        stop = min(start + count, self.length)
+        if start >= stop:
+            return
+        if start <= self.length - stop:
+            curr = self.head
+            for _ in range(start):
+                curr = curr.next
+        else:
+            curr = self.tail
+            for _ in range(self.length - 1 - start):
+                curr = curr.prev
+        for _ in range(stop - start):
+            yield curr.data
+            curr = curr.next
+    def add_node(self, data):
+        new_node = DLL_Node(data)
+        if self.index is not None:
+            self.index.add_last(new_node)
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+            new_node.prev = self.tail
+        self.tail = new_node
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        new_node = DLL_Node(data)
+        if self.index is not None:
+            self.index.add_first(new_node)
+        if self.head:
+            self.head.prev = new_node
+        else:
+            self.tail = new_node
+        new_node.next = self.head
+        self.head = new_node
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first node holding `key`, or None."""
+        if self.index is not None:
+            return self.index.first(key)
+        curr = self.head
+        while curr and curr.data != key:
+            curr = curr.next
+        return curr
+    def contains(self, key):
+        return self.find(key) is not None
+    def delete_node(self, key):
+        curr = self.find(key)
+        if not curr:
+            return False
+        self._unlink(curr.prev, curr)
+        return True
+    def _locate(self, key):
+        """Returns (predecessor, node) for the first node holding `key`, or None."""
+        node = self.find(key)
+        return (node.prev, node) if node else None
+    def _link_after(self, prev, node):
+        """Links a detached `node` after `prev` (None for the head); the inverse of _unlink."""
+        at_tail = prev is not None and prev is self.tail
+        node.prev = prev
+        if prev:
+            node.next = prev.next
+            prev.next = node
+        else:
+            node.next = self.head
+            self.head = node
+        if node.next:
+            node.next.prev = node
+        else:
+            self.tail = node
+        if self.index is not None:
+            # See SinglyLinkedList._link_after for why mid-chain goes first.
+            if at_tail:
+                self.index.add_last(node)
+            else:
+                self.index.add_first(node)
+        self.length += 1
+        self.version += 1
+    def _unlink(self, prev, node):
+        """Removes `node` from the chain. `prev` is taken for symmetry with the other lists; node.prev is used."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        if self.index is not None:
+            self.index.remove(node)
+        node.next = node.prev = None
+        self.length -= 1
+        self.version += 1
+    @classmethod
+    def from_iterable(cls, app, iterable, **kwargs):
+        linked_list = cls(app, **kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = link_chain(DLL_Node, iterable, doubly=True)
+        if not count:
+            return 0
+        if self.index is not None:
+            self.index.add_run(first, count)
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = link_chain(DLL_Node, iterable, doubly=True)
+        if not count:
+            return 0
+        if self.index is not None:
+            self.index.add_run(first, count, at_front=True)
+        if self.head:
+            self.head.prev = last
+        else:
+            self.tail = last
+        last.next = self.head
+        self.head = first
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys, on_unlink=None):
+        """
+        Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed.
+        on_unlink(prev, node) is called for each node unlinked by the pass, with prev as _locate reports it.
+        """
+        if self.index is not None:
+            return sum(1 for key in keys if self.delete_node(key))
+        pending = Counter(keys)
+        removed = 0
+        curr = self.head
+        while curr and pending:
+            next_node = curr.next
+            if pending.get(curr.data):
+                pending[curr.data] -= 1
+                if not pending[curr.data]:
+                    del pending[curr.data]
+                if on_unlink is not None:
+                    on_unlink(curr.prev, curr)
+                self._unlink(curr.prev, curr)
+                removed += 1
+            curr = next_node
+        return removed
+    def reverse(self):
+        temp = None
+        current = self.head
+        self.tail = current
+        while current:
+            temp = current.prev
+            current.prev = current.next
+            current.next = temp
+            current = current.prev
+        if temp:
+            self.head = temp.prev
+        self.version += 1
+        if self.index is not None:
+            self.index.reverse()
+    def to_list(self):
+        nodes = []
+        curr = self.head
+        while curr:
+            nodes.append(curr.data)
+            curr = curr.next
+        return nodes
+
+class CLL_Node: 
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+class CircularLinkedList:
+    def __init__(self, app, indexed=False):
+        self.head = None
+        self.tail = None # tail.next is always head, so both ends are O(1)
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+        # Optional value -> nodes index, plus node -> predecessor map (the
+        # head's predecessor is the tail) for O(1) indexed deletes.
+        self.index = NodeIndex() if indexed else None
+        self.prev_of = {} if indexed else None
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) is not None
+    def __iter__(self):
+        curr = self.head
+        for _ in range(self.length):
+            yield curr.data
+            curr = curr.next
+    def __reversed__(self):
+        # No back links, so the values have to be collected first.
+        return reversed(self.to_list())
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, without copying the list."""
+        start = max(start, 0)
+        return islice(self, start, start + max(count, 0))
+    def add_node(self, data):
+        new_node = CLL_Node(data)
+        if self.index is not None:
+            self.index.add_last(new_node)
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        new_node.next = self.head
+        if self.prev_of is not None:
+            self.prev_of[new_node] = self.tail if self.tail else new_node
+            self.prev_of[self.head] = new_node
+        self.tail = new_node
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        new_node = CLL_Node(data)
+        if self.index is not None:
+            self.index.add_first(new_node)
+        if not self.head:
+            self.tail = new_node
+        else:
+            new_node.next = self.head
+        if self.prev_of is not None:
+            if self.head:
+                self.prev_of[self.head] = new_node
+            self.prev_of[new_node] = self.tail
+        self.head = new_node
+        self.tail.next = new_node
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first node (from head) holding `key`, or None."""
+        if self.index is not None:
+            return self.index.first(key)
+        curr = self.head
+        for _ in range(self.length):
+            if curr.data == key:
+                return curr
+            curr = curr.next
+        return None
+    def contains(self, key):
+        return self.find(key) is not None
+    def delete_node(self, key):
+        found = self._locate(key)
+        if not found:
+            return False
+        self._unlink(*found)
+        return True
+    def _locate(self, key):
+        """Returns (predecessor, node) for the first node holding `key`, or None. A head node is reported with predecessor None."""
+        if self.index is not None:
+            node = self.index.first(key)
+            if not node:
+                return None
+            return (None if node is self.head else self.prev_of[node]), node
+        prev = None
+        curr = self.head
+        for _ in range(self.length):
+            if curr.data == key:
+                return prev, curr
+            prev = curr
+            curr = curr.next
+        return None
+    def _link_after(self, prev, node):
+        """Links a detached `node` after `prev`, or in as the new head when prev is None; the inverse of _unlink."""
+        at_tail = prev is not None and prev is self.tail
+        if not self.head:
+            node.next = node
+            self.head = self.tail = node
+        elif prev is None:
+            node.next = self.head
+            self.tail.next = node
+            self.head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+            if at_tail:
+                self.tail = node
+        if self.index is not None:
+            # See SinglyLinkedList._link_after for why mid-chain goes first.
+            if at_tail:
+                self.index.add_last(node)
+            else:
+                self.index.add_first(node)
+            self.prev_of[node] = prev if prev else self.tail
+            self.prev_of[node.next] = node
+        self.length += 1
+        self.version += 1
+    def _unlink(self, prev, node):
+        """Removes `node`, whose predecessor in the ring is `prev` (None means the tail)."""
+        if prev is None:
+            prev = self.tail
+        if node.next == node:
+            self.head = None
+            self.tail = None
+        else:
+            prev.next = node.next
+            if node == self.head:
+                self.head = node.next
+            if node == self.tail:
+                self.tail = prev
+            if self.prev_of is not None:
+                self.prev_of[node.next] = prev
+        if self.index is not None:
+            self.index.remove(node)
+            del self.prev_of[node]
+        node.next = None
+        self.length -= 1
+        self.version += 1
+    @classmethod
+    def from_iterable(cls, app, iterable, **kwargs):
+        linked_list = cls(app, **kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = link_chain(CLL_Node, iterable)
+        if not count:
+            return 0
+        if self.index is not None:
+            self.index.add_run(first, count)
+            self._map_predecessors(first, count, self.tail)
+        if self.tail:
+            self.tail.next = first
+        else:
+            self.head = first
+        last.next = self.head
+        self.tail = last
+        if self.prev_of is not None:
+            self.prev_of[self.head] = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = link_chain(CLL_Node, iterable)
+        if not count:
+            return 0
+        if not self.tail:
+            self.tail = last
+        if self.index is not None:
+            self.index.add_run(first, count, at_front=True)
+            self._map_predecessors(first, count, self.tail)
+            if self.head:
+                self.prev_of[self.head] = last
+        last.next = self.head if self.head else first
+        self.head = first
+        self.tail.next = first
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys, on_unlink=None):
+        """
+        Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed.
+        on_unlink(prev, node) is called for each node unlinked by the pass, with prev as _locate reports it.
+        """
+        if self.index is not None:
+            return sum(1 for key in keys if self.delete_node(key))
+        pending = Counter(keys)
+        removed = 0
+        prev = self.tail
+        curr = self.head
+        for _ in range(self.length):
+            if not pending:
+                break
+            next_node = curr.next
+            if pending.get(curr.data):
+                pending[curr.data] -= 1
+                if not pending[curr.data]:
+                    del pending[curr.data]
+                if on_unlink is not None:
+                    on_unlink(None if curr is self.head else prev, curr)
+                self._unlink(prev, curr)
+                removed += 1
+            else:
+                prev = curr
+            curr = next_node
+        return removed
+    def _map_predecessors(self, first, count, before):
+        """Records predecessors for `count` chained nodes, the first of which follows `before`."""
+        node = first
+        for _ in range(count):
+            self.prev_of[node] = before
+            before = node
+            node = node.next
+    def reverse(self):
+        if not self.head or self.head.next == self.head:
+            return
+        # Rewire every next pointer in place; the old tail is the
+        # predecessor of the head, so the ring stays closed throughout.
+        prev = self.tail
+        current = self.head
+        prev_of = self.prev_of
+        for _ in range(self.length):
+            next_node = current.next
+            current.next = prev
+            if prev_of is not None:
+                prev_of[current] = next_node
+            prev = current
+            current = next_node
+        self.head, self.tail = self.tail, self.head
+        self.version += 1
+        if self.index is not None:
+            self.index.reverse()
+    def to_list(self):
+        nodes = []
+        if not self.head:
+            return nodes
+        curr = self.head
+        while True:
+            nodes.append(curr.data)
+            curr = curr.next
+            if curr == self.head:
+                break
+        return nodes
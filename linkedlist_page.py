@@ -1,12 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import math
 import random
+from itertools import islice
+
+from core import LIST_ENGINES, VALUE_RANGE, OperationJournal, PersistentSinglyLinkedList
 
 class LinkedListPage(ttk.Frame):
     def __init__(self, parent_container, main_app):
         super().__init__(parent_container, style="Main.TFrame")
         self.main_app = main_app
         self.active_list_type = "singly"
+        self.journal = OperationJournal(max_history=1000)
+        # The pooled engine stores values in 64-bit slots, including once Keep
+        # Versions hands the singly list back to it.
+        self.value_range = VALUE_RANGE if main_app.list_classes == LIST_ENGINES["pool"] else None
+        self.list_rows = {} # list name -> ListRow, the canvas items kept between redraws
+        self.zoom = 1.0 # Horizontal scale of the rows
+        self.lod_min_px = 30 # Below this many pixels per node, runs of nodes collapse into blocks
+        self.scroll_width = 1
         
         # --- Create the Left/Right split ---
         self.horizontal_paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -25,6 +37,7 @@ class LinkedListPage(ttk.Frame):
         
         # Apply theme immediately on creation
         self.apply_theme()
+        self.update_representation()
 
     def create_control_widgets(self):
         """Creates the controls for the left panel."""
@@ -60,13 +73,27 @@ class LinkedListPage(ttk.Frame):
         self.create_list_controls(self.dll_frame, "doubly")
         self.create_list_controls(self.cll_frame, "circular")
 
+        # --- Undo/Redo (Ctrl+Z / Ctrl+Y undo or redo one step) ---
+        history_frame = ttk.Frame(self.control_panel)
+        history_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.undo_btn = ttk.Button(history_frame, text="Undo", command=lambda: self.undo(self.get_history_steps()))
+        self.undo_btn.pack(side=tk.LEFT, padx=2)
+        self.redo_btn = ttk.Button(history_frame, text="Redo", command=lambda: self.redo(self.get_history_steps()))
+        self.redo_btn.pack(side=tk.LEFT, padx=2)
+        ttk.Label(history_frame, text="Steps:").pack(side=tk.LEFT, padx=(8, 2))
+        self.history_steps_var = tk.StringVar(value="1")
+        ttk.Spinbox(history_frame, from_=1, to=1000, width=5, textvariable=self.history_steps_var).pack(side=tk.LEFT)
+        self.history_frame = history_frame
+        self.history_note = ttk.Label(self.control_panel, wraplength=220) # Shown only while history is off
+        self.refresh_history_controls()
+
     def create_list_controls(self, parent_frame, list_type):
         """Creates the common control elements for each linked list type tab."""
         
         # --- Validation for numeric input ---
         vcmd = (self.register(self._validate_numeric_input), '%P')
 
-        ttk.Label(parent_frame, text="Node Value:").pack(pady=(10, 0))
+        ttk.Label(parent_frame, text="Node Value(s), e.g. 4, 8, 15:").pack(pady=(10, 0))
         entry_var = tk.StringVar()
         entry = ttk.Entry(parent_frame, textvariable=entry_var,
                           validate='key', validatecommand=vcmd)
@@ -82,6 +109,17 @@ class LinkedListPage(ttk.Frame):
 
         ttk.Button(parent_frame, text="Random Node", command=lambda: self.perform_action(list_type, "random")).pack(fill=tk.X, padx=10, pady=5) # Renamed button slightly
         ttk.Button(parent_frame, text="Reverse Order", command=lambda: self.perform_action(list_type, "reverse")).pack(fill=tk.X, padx=10, pady=5)
+
+        if list_type == "singly":
+            # --- Persistent mode: every change becomes a version to scrub through ---
+            self.persistent_var = tk.BooleanVar(value=False)
+            ttk.Checkbutton(parent_frame, text="Keep Versions", variable=self.persistent_var,
+                            command=self.toggle_persistent_sll).pack(fill=tk.X, padx=10, pady=(5, 0))
+            self.version_label_var = tk.StringVar(value="")
+            ttk.Label(parent_frame, textvariable=self.version_label_var).pack(padx=10)
+            self.version_scale = ttk.Scale(parent_frame, from_=0, to=0, orient=tk.HORIZONTAL, command=self.on_version_scrub)
+            self.version_scale.pack(fill=tk.X, padx=10, pady=5)
+            self.version_scale.state(["disabled"])
         
         # Spacer
         ttk.Frame(parent_frame, style="NotebookTab.TFrame").pack(fill='both', expand=True)
@@ -90,19 +128,69 @@ class LinkedListPage(ttk.Frame):
         """Creates the canvas for the right panel."""
         ttk.Label(self.representation_panel, text="Representation: Linked Lists", style="Header.TLabel").pack(pady=5)
 
+        # --- Zoom (Ctrl+mouse wheel also zooms around the pointer) ---
+        zoom_frame = ttk.Frame(self.representation_panel)
+        zoom_frame.pack(fill=tk.X, padx=10)
+        ttk.Button(zoom_frame, text="-", width=3, command=lambda: self.set_zoom(self.zoom / self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="+", width=3, command=lambda: self.set_zoom(self.zoom * self.ZOOM_STEP)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="1:1", width=4, command=lambda: self.set_zoom(1.0)).pack(side=tk.LEFT, padx=2)
+        self.zoom_label_var = tk.StringVar(value="100%")
+        ttk.Label(zoom_frame, textvariable=self.zoom_label_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(zoom_frame, text="Collapse below (px/node):").pack(side=tk.LEFT, padx=(10, 2))
+        self.lod_var = tk.StringVar(value=str(self.lod_min_px))
+        ttk.Spinbox(zoom_frame, from_=2, to=200, width=5, textvariable=self.lod_var,
+                    command=self.on_lod_change).pack(side=tk.LEFT)
+
         self.canvas_frame = ttk.Frame(self.representation_panel, style="Canvas.TFrame")
         self.canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         self.canvas = tk.Canvas(self.canvas_frame, bg="white")
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.canvas_v_scroll = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas_v_scroll = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.scroll_y)
         self.canvas_v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.canvas_h_scroll = ttk.Scrollbar(self.representation_panel, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas_h_scroll = ttk.Scrollbar(self.representation_panel, orient=tk.HORIZONTAL, command=self.scroll_x)
         self.canvas_h_scroll.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
         
         self.canvas.config(yscrollcommand=self.canvas_v_scroll.set, xscrollcommand=self.canvas_h_scroll.set)
+        # Only the visible nodes have canvas items, so scrolling or resizing re-fills the viewport.
+        self.canvas.bind("<Configure>", lambda e: self.main_app.request_redraw(self))
+        self.canvas.bind("<Control-MouseWheel>", lambda e: self.set_zoom(self.zoom * (self.ZOOM_STEP if e.delta > 0 else 1 / self.ZOOM_STEP), e.x))
+        self.canvas.bind("<Control-Button-4>", lambda e: self.set_zoom(self.zoom * self.ZOOM_STEP, e.x))
+        self.canvas.bind("<Control-Button-5>", lambda e: self.set_zoom(self.zoom / self.ZOOM_STEP, e.x))
+
+    ZOOM_STEP = 1.25
+    MIN_ZOOM = 1e-4
+    MAX_ZOOM = 2.0
+
+    def set_zoom(self, zoom, anchor_px=0):
+        """Rescales the rows horizontally, keeping the point under `anchor_px` (window x) in place."""
+        zoom = min(max(zoom, self.MIN_ZOOM), self.MAX_ZOOM)
+        origin = ListRow.slot_origin(self.list_x_offset)
+        logical_x = (self.canvas.canvasx(anchor_px) - origin) / self.zoom
+        self.zoom = zoom
+        self.zoom_label_var.set(f"{zoom:.2%}" if zoom < 0.01 else f"{zoom:.0%}")
+        self.invalidate_canvas()
+        self.draw_lists()
+        self.canvas.xview_moveto(max(0.0, origin + logical_x * zoom - anchor_px) / self.scroll_width)
+        self.draw_lists()
+
+    def on_lod_change(self):
+        try:
+            self.lod_min_px = max(2, int(self.lod_var.get()))
+        except ValueError:
+            return
+        self.invalidate_canvas()
+        self.draw_lists()
+
+    def scroll_x(self, *args):
+        self.canvas.xview(*args)
+        self.draw_lists()
+
+    def scroll_y(self, *args):
+        self.canvas.yview(*args)
+        self.draw_lists()
 
     def on_tab_change(self, event):
         """Updates active_list_type when a new tab is selected."""
@@ -114,7 +202,7 @@ class LinkedListPage(ttk.Frame):
         elif selected_tab == "Circular":
             self.active_list_type = "circular"
         self.main_app.log_output(f"Switched to {self.active_list_type.capitalize()} Linked List tab.")
-        self.update_representation()
+        self.refresh_history_controls()
 
     def get_active_list_object(self):
         """Returns the currently active linked list object from main_app."""
@@ -138,48 +226,187 @@ class LinkedListPage(ttk.Frame):
 
     def perform_action(self, list_type, action):
         """Handles actions for linked lists."""
+        timing = self.main_app.latency.start(f"{list_type} {action}")
+        completed = self.main_app.measure_costs(f"{list_type} {action}", self.apply_action, list_type, action)
+        timing.lap("model")
+        # Input errors wait on a dialog, so their timings are dropped
+        self.main_app.request_redraw(self, timing if completed else None)
+
+    def apply_action(self, list_type, action):
+        """Runs one action on the active list; returns False on an input error. The caller redraws."""
         linked_list = self.get_active_list_object()
-        if not linked_list:
-            return
+        if linked_list is None:
+            return False
 
         active_entry_var = self.get_active_entry_var()
         value = active_entry_var.get() if active_entry_var else ""
         
+        values = self.parse_values(value)
+        # Check before any value is linked in
+        if self.value_range is not None and any(v not in self.value_range for v in values):
+            messagebox.showwarning("Input Error", f"The pooled lists hold 64-bit integers (up to {self.value_range[-1]}).")
+            return False
+
         if action == "append":
-            if not value: return messagebox.showwarning("Input Error", "Please enter a value to append.")
-            linked_list.add_node(int(value))
-            self.main_app.log_output(f"Appended {value} to {list_type} list.")
+            if not values:
+                messagebox.showwarning("Input Error", "Please enter a value to append.")
+                return False
+            if len(values) == 1:
+                self.journal.append(linked_list, values[0])
+                self.main_app.log_output(f"Appended {values[0]} to {list_type} list.")
+            else:
+                self.journal.extend(linked_list, values)
+                self.main_app.log_output(f"Appended {len(values)} values to {list_type} list.")
             if active_entry_var: active_entry_var.set("") 
 
         elif action == "prepend":
-            if not value: return messagebox.showwarning("Input Error", "Please enter a value to prepend.")
-            linked_list.prepend_node(int(value))
-            self.main_app.log_output(f"Prepended {value} to {list_type} list.")
+            if not values:
+                messagebox.showwarning("Input Error", "Please enter a value to prepend.")
+                return False
+            if len(values) == 1:
+                self.journal.prepend(linked_list, values[0])
+                self.main_app.log_output(f"Prepended {values[0]} to {list_type} list.")
+            else:
+                self.journal.prepend_all(linked_list, values)
+                self.main_app.log_output(f"Prepended {len(values)} values to {list_type} list.")
             if active_entry_var: active_entry_var.set("") 
 
         elif action == "delete":
-            if not value: return messagebox.showwarning("Input Error", "Please enter a value to delete.")
-            if linked_list.delete_node(int(value)):
-                self.main_app.log_output(f"Deleted {value} from {list_type} list.")
+            if not values:
+                messagebox.showwarning("Input Error", "Please enter a value to delete.")
+                return False
+            if len(values) == 1:
+                deleted = 1 if self.journal.delete(linked_list, values[0]) else 0
+            else:
+                deleted = self.journal.delete_many(linked_list, values)
+            if deleted:
+                if len(values) == 1:
+                    self.main_app.log_output(f"Deleted {values[0]} from {list_type} list.")
+                else:
+                    self.main_app.log_output(f"Deleted {deleted} of {len(values)} values from {list_type} list.")
                 if active_entry_var: active_entry_var.set("") 
             else:
                 messagebox.showerror("Deletion Error", f"Node {value} not found in {list_type} list.")
                 self.main_app.log_output(f"Failed to delete {value} (not found) from {list_type} list.")
+                return False
         
         elif action == "random":
             random_value = random.randint(1, 100)
-            linked_list.add_node(random_value)
+            self.journal.append(linked_list, random_value)
             self.main_app.log_output(f"Added random node {random_value} to {list_type} list.")
         
         elif action == "reverse":
-            linked_list.reverse()
+            self.journal.reverse(linked_list)
             self.main_app.log_output(f"Reversed {list_type} list.")
-        
-        self.update_representation()
+        return True
+
+    def toggle_persistent_sll(self):
+        """Swaps the singly list between the mutable and the persistent model, keeping its values."""
+        old_list = self.main_app.sll
+        # Build the replacement completely before swapping it in, so a failure leaves the old list in place
+        if self.persistent_var.get():
+            new_list = PersistentSinglyLinkedList.from_iterable(self.main_app, old_list)
+            message = f"Singly list now keeps a version per change (the last {new_list.max_versions})."
+        else:
+            try:
+                new_list = self.main_app.list_classes[0](self.main_app)
+                new_list.extend(old_list)
+            except OverflowError:
+                self.persistent_var.set(True)
+                messagebox.showwarning("Input Error", "The singly list holds values too large for the pooled engine.")
+                self.main_app.log_output("Kept the version history: a value does not fit the pooled engine.")
+                return
+            message = "Singly list version history discarded."
+        self.main_app.sll = new_list
+        self.main_app.log_output(message)
+        self.journal.forget(old_list)
+        self.main_app.replace_cost_model(old_list, self.main_app.sll)
+        self.refresh_history_controls()
+        self.main_app.request_redraw(self)
+
+    def on_version_scrub(self, value):
+        """Shows the singly list as it was at the version under the slider."""
+        sll = self.main_app.sll
+        version = round(float(value))
+        if not hasattr(sll, "checkout") or version == sll.current:
+            return
+        sll.checkout(version)
+        self.main_app.request_redraw(self)
+
+    def refresh_version_controls(self):
+        """Syncs the version slider and label with the singly list."""
+        sll = self.main_app.sll
+        if not hasattr(sll, "checkout"):
+            self.version_label_var.set("")
+            self.version_scale.state(["disabled"])
+            return
+        self.version_scale.state(["!disabled"])
+        self.version_scale.config(from_=sll.first_version, to=sll.last_version)
+        self.version_scale.set(sll.current)
+        label = sll.version_entry(sll.current)[2]
+        self.version_label_var.set(f"Version {sll.current} / {sll.last_version}: {label}")
+
+    def get_history_steps(self):
+        """Returns the Undo/Redo step count from the spinbox (at least 1)."""
+        try:
+            return max(1, int(self.history_steps_var.get()))
+        except ValueError:
+            return 1
+
+    def get_history_off_reason(self):
+        """Returns why the active list's operations cannot be undone, or None if they are recorded."""
+        linked_list = self.get_active_list_object()
+        if linked_list is None or OperationJournal.can_record(linked_list):
+            return None
+        # The pooled lists recycle a deleted node's slot at once, so the journal
+        # has nothing to link back in; their history is switched off instead.
+        return "Undo/Redo is off for this list: the pooled lists reuse deleted node slots, so they cannot be restored."
+
+    def refresh_history_controls(self):
+        """Enables Undo/Redo for a recorded active list; otherwise disables them and shows why."""
+        reason = self.get_history_off_reason()
+        state = ["disabled"] if reason else ["!disabled"]
+        self.undo_btn.state(state)
+        self.redo_btn.state(state)
+        if reason:
+            self.history_note.config(text=reason)
+            self.history_note.pack(fill=tk.X, padx=10, pady=(0, 10), after=self.history_frame)
+        else:
+            self.history_note.pack_forget()
+
+    def undo(self, steps=1):
+        """Undoes up to `steps` list operations, then redraws once."""
+        reason = self.get_history_off_reason()
+        if reason:
+            self.main_app.log_output(reason)
+            return
+        done = self.journal.undo(steps)
+        if done:
+            self.main_app.log_output(f"Undid {done} list operation(s).")
+            self.main_app.request_redraw(self)
+        else:
+            self.main_app.log_output("Nothing to undo.")
+
+    def redo(self, steps=1):
+        """Redoes up to `steps` undone list operations, then redraws once."""
+        reason = self.get_history_off_reason()
+        if reason:
+            self.main_app.log_output(reason)
+            return
+        done = self.journal.redo(steps)
+        if done:
+            self.main_app.log_output(f"Redid {done} list operation(s).")
+            self.main_app.request_redraw(self)
+        else:
+            self.main_app.log_output("Nothing to redo.")
+
+    def parse_values(self, text):
+        """Splits entry text such as "4, 8 15" into a list of ints."""
+        return [int(v) for v in text.replace(",", " ").split()]
 
     def _validate_numeric_input(self, P):
-        """Validates that the input is a digit or an empty string."""
-        if P.isdigit() or P == "":
+        """Validates that the input holds only digits, commas and spaces."""
+        if all(ch.isdigit() or ch in ", " for ch in P):
             return True
         self.bell() # Audible feedback for invalid input
         return False
@@ -187,106 +414,268 @@ class LinkedListPage(ttk.Frame):
     def apply_theme(self):
         """Applies the current theme from main_app to this page's widgets."""
         theme = self.main_app.theme
-        
-        self.main_app.style.configure("Accent.TButton", 
-                                      background=theme["accent"], 
-                                      foreground=theme["btn_fg"])
-        self.main_app.style.map("Accent.TButton",
-                                background=[('active', theme["accent_active"])])
-        
         self.canvas.config(bg=theme["canvas_bg"])
         self.canvas_v_scroll.config(style="Vertical.TScrollbar")
         self.canvas_h_scroll.config(style="Horizontal.TScrollbar")
-        
-        self.update_representation() 
+        self.main_app.recolor_canvas(self.canvas)
 
-    def update_representation(self):
-        """Redraws the linked lists on the canvas."""
+    list_x_offset = 50
+
+    def invalidate_canvas(self):
+        """Drops every canvas item so the next update_representation draws from scratch (e.g. on a zoom change)."""
         self.canvas.delete("all")
+        self.list_rows.clear()
+
+    def update_representation(self):
+        """Brings the canvas up to date with the linked lists, touching only the items that changed."""
+        self.refresh_version_controls()
+        self.draw_lists()
+
+    def draw_lists(self):
+        """
+        Renders the part of each list inside the viewport; the scroll region
+        still spans every node. A row whose list version and visible slots
+        are unchanged is skipped without touching the list.
+        """
         theme = self.main_app.theme
 
         node_width = 80
         node_height = 40
-        x_offset = 50
+        x_offset = self.list_x_offset
         y_offset = 40
         y_spacing = 100
-        
-        self.draw_list_on_canvas(self.main_app.sll, "Singly", x_offset, y_offset, node_width, node_height)
-        y_offset += y_spacing + node_height
-        self.draw_list_on_canvas(self.main_app.dll, "Doubly", x_offset, y_offset, node_width, node_height)
-        y_offset += y_spacing + node_height
-        self.draw_list_on_canvas(self.main_app.cll, "Circular", x_offset, y_offset, node_width, node_height)
-
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            self.canvas.config(scrollregion=(0, 0, bbox[2] + 50, bbox[3] + 50))
-        else:
-            self.canvas.config(scrollregion=(0, 0, 1, 1))
 
-    def draw_list_on_canvas(self, linked_list_obj, list_name, start_x, start_y, node_w, node_h):
-        """Draws a single linked list type on the canvas."""
-        theme = self.main_app.theme
-        
-        self.canvas.create_text(start_x, start_y - 20, text=f"{list_name}:", anchor="nw",
-                                 fill=theme["fg"], font=("Arial", 12, "bold"))
-        
-        nodes_data = linked_list_obj.to_list()
-        
-        if not nodes_data and list_name != "Circular":
-            self.canvas.create_text(start_x + node_w + 10, start_y + node_h // 2, text="EMPTY", anchor="w",
-                                     fill=theme["fg"], font=("Arial", 10))
+        margin = ListRow.VIEW_MARGIN
+        view = (self.canvas.canvasx(0) - margin, self.canvas.canvasy(0) - margin,
+                self.canvas.canvasx(self.canvas.winfo_width()) + margin,
+                self.canvas.canvasy(self.canvas.winfo_height()) + margin)
+
+        right = bottom = 0
+        for linked_list_obj, list_name in ((self.main_app.sll, "Singly"), (self.main_app.dll, "Doubly"),
+                                           (self.main_app.cll, "Circular")):
+            row = self.list_rows.get(list_name)
+            if row is None:
+                row = self.list_rows[list_name] = ListRow(self.canvas, list_name, x_offset, y_offset, node_width, node_height,
+                                                          self.zoom, self.lod_min_px)
+            row.render(linked_list_obj, theme, view)
+            right = max(right, row.right_edge())
+            bottom = y_offset + node_height + 20
+            y_offset += y_spacing + node_height
+
+        # The row geometry is fixed, so the scroll region is computed instead of asking Tk for bbox("all").
+        self.scroll_width = right + 50
+        self.canvas.config(scrollregion=(0, 0, self.scroll_width, bottom + 50))
+
+class ListRow:
+    """
+    The canvas items of one list row, kept between frames. Only the node
+    slots inside the viewport (plus VIEW_MARGIN pixels) get items, fetched
+    with iter_range, so the item count is bounded by the window size rather
+    than the list length. Slots that scroll out are recycled: their items
+    are moved and re-labelled for the slots that scroll in. Slots that stay
+    in view are only re-labelled when their value changed, so an append
+    costs O(1) canvas operations.
+
+    The row is scaled horizontally by `zoom`. Once a node gets narrower than
+    `lod_min_px`, runs of nodes collapse into blocks about BLOCK_PX wide,
+    labelled with their node count and value range, which keeps the item
+    count bounded by the screen width at any zoom.
+    """
+    VIEW_MARGIN = 400
+    BLOCK_PX = 70
+
+    def __init__(self, canvas, list_name, start_x, start_y, node_w, node_h, zoom=1.0, lod_min_px=30):
+        self.canvas = canvas
+        self.list_name = list_name
+        self.start_x = start_x
+        self.start_y = start_y
+        self.empty_x = start_x + node_w + 10
+        self.node_w = node_w * zoom
+        self.gap = 30 * zoom
+        self.node_h = node_h
+        # Nodes per drawn slot: 1 shows every node, more shows aggregate blocks
+        pitch = self.node_w + self.gap
+        self.block_size = 1 if pitch >= lod_min_px else math.ceil(self.BLOCK_PX / pitch)
+        self.length = None # Logical length at the last render
+        self.slots = {} # slot index -> (rect id, text id, value or (count, min, max) shown)
+        self.arrows = {} # slot index i -> item ids of the arrow(s) linking slot i to slot i + 1
+        self.decor = [] # Head/EMPTY/NULL labels and the circular return arrow; they depend only on the length
+        self.title = None
+        self.drawn = None # (model, model version, first slot, last slot) at the last render
+
+    @staticmethod
+    def slot_origin(start_x):
+        return start_x + 50
+
+    def slot_x(self, i):
+        """Left edge of node i."""
+        return self.slot_origin(self.start_x) + i * (self.node_w + self.gap)
+
+    def right_edge(self):
+        return self.slot_x(self.length or 0) + 40
+
+    def visible_slots(self, n, view):
+        """Returns the [first, last) slot indices that overlap `view` (x0, y0, x1, y1)."""
+        x0, y0, x1, y1 = view
+        if y1 < self.start_y - 20 or y0 > self.start_y + self.node_h + 30:
+            return 0, 0
+        pitch = (self.node_w + self.gap) * self.block_size
+        slots = -(-n // self.block_size)
+        first = max(0, int((x0 - self.slot_x(0)) // pitch))
+        last = min(slots, int((x1 - self.slot_x(0)) // pitch) + 1)
+        return first, max(first, last)
+
+    def render(self, linked_list_obj, theme, view):
+        """Brings the row up to date; a no-op (no traversal) when neither the list nor the visible slots changed."""
+        canvas = self.canvas
+        n = len(linked_list_obj)
+        first, last = self.visible_slots(n, view)
+        drawn = (linked_list_obj, linked_list_obj.version, first, last)
+        if drawn == self.drawn:
             return
-        
-        current_x = start_x + 50
-        
-        self.canvas.create_text(current_x - 30, start_y + node_h // 2, text="Head", anchor="e",
-                                 fill=theme["head_color"], font=("Arial", 10, "bold"))
-        
-        if list_name == "Circular" and not nodes_data:
-            self.canvas.create_text(current_x + node_w // 2, start_y + node_h // 2, text="EMPTY", anchor="center",
-                                     fill=theme["fg"], font=("Arial", 10))
+        self.drawn = drawn
+        if self.block_size > 1:
+            self.render_blocks(linked_list_obj, theme, n, first, last)
+            return
+        mid_y = self.start_y + self.node_h / 2
+        if self.title is None:
+            self.title = canvas.create_text(self.start_x, self.start_y - 20, text=f"{self.list_name}:", anchor="nw",
+                                            fill=theme["fg"], font=("Arial", 12, "bold"), tags="text")
+
+        spare = [self.slots.pop(i) for i in [i for i in self.slots if not first <= i < last]]
+        for i, value in enumerate(linked_list_obj.iter_range(first, last - first), start=first):
+            slot = self.slots.get(i)
+            x1 = self.slot_x(i)
+            if slot is None:
+                if spare:
+                    rect, text, _ = spare.pop()
+                    canvas.coords(rect, x1, self.start_y, x1 + self.node_w, self.start_y + self.node_h)
+                    canvas.coords(text, x1 + self.node_w / 2, mid_y)
+                    canvas.itemconfig(text, text=str(value))
+                else:
+                    rect = canvas.create_rectangle(x1, self.start_y, x1 + self.node_w, self.start_y + self.node_h,
+                                                   fill=theme["node_fill"], outline=theme["node_border"], width=1, tags="node")
+                    text = canvas.create_text(x1 + self.node_w / 2, mid_y, text=str(value),
+                                              fill=theme["fg"], font=("Arial", 10), tags="text")
+                self.slots[i] = (rect, text, value)
+            elif slot[2] != value:
+                canvas.itemconfig(slot[1], text=str(value))
+                self.slots[i] = (slot[0], slot[1], value)
+        for rect, text, _ in spare:
+            canvas.delete(rect, text)
+
+        arrow_last = min(last, n - 1)
+        spare = [self.arrows.pop(i) for i in [i for i in self.arrows if not first <= i < arrow_last]]
+        for i in range(first, arrow_last):
+            if i in self.arrows:
+                continue
+            arrow_start_x = self.slot_x(i) + self.node_w
+            arrow_end_x = self.slot_x(i + 1)
+            if spare:
+                ids = spare.pop()
+                canvas.coords(ids[0], arrow_start_x, mid_y, arrow_end_x, mid_y)
+                if len(ids) > 1:
+                    canvas.coords(ids[1], arrow_end_x, mid_y + 5, arrow_start_x, mid_y + 5)
+            else:
+                ids = [canvas.create_line(arrow_start_x, mid_y, arrow_end_x, mid_y, arrow=tk.LAST, fill=theme["arrow_color"], tags="arrow")]
+                if self.list_name == "Doubly":
+                    ids.append(canvas.create_line(arrow_end_x, mid_y + 5, arrow_start_x, mid_y + 5,
+                                                  arrow=tk.LAST, fill=theme["arrow_color"], tags="arrow"))
+            self.arrows[i] = ids
+        for ids in spare:
+            canvas.delete(*ids)
+
+        if n != self.length:
+            self.draw_decor(n, theme)
+            self.length = n
+
+    def render_blocks(self, linked_list_obj, theme, n, first, last):
+        """Like render, but each slot is a block of `block_size` nodes showing its count and value range."""
+        canvas = self.canvas
+        k = self.block_size
+        mid_y = self.start_y + self.node_h / 2
+        if self.title is None:
+            self.title = canvas.create_text(self.start_x, self.start_y - 20, text=f"{self.list_name}:", anchor="nw",
+                                            fill=theme["fg"], font=("Arial", 12, "bold"), tags="text")
+
+        values = linked_list_obj.iter_range(first * k, (last - first) * k)
+        spare = [self.slots.pop(b) for b in [b for b in self.slots if not first <= b < last]]
+        for b in range(first, last):
+            run = list(islice(values, k))
+            summary = (len(run), min(run), max(run))
+            x1 = self.slot_x(b * k)
+            x2 = self.slot_x(b * k + len(run) - 1) + self.node_w
+            label = str(run[0]) if len(run) == 1 else f"{len(run)} nodes\n{summary[1]}..{summary[2]}"
+            slot = self.slots.get(b)
+            if slot is None:
+                if spare:
+                    rect, text, _ = spare.pop()
+                    canvas.coords(rect, x1, self.start_y, x2, self.start_y + self.node_h)
+                    canvas.coords(text, (x1 + x2) / 2, mid_y)
+                    canvas.itemconfig(text, text=label)
+                else:
+                    rect = canvas.create_rectangle(x1, self.start_y, x2, self.start_y + self.node_h,
+                                                   fill=theme["node_fill"], outline=theme["node_border"], width=1, tags="node")
+                    text = canvas.create_text((x1 + x2) / 2, mid_y, text=label, justify=tk.CENTER,
+                                              fill=theme["fg"], font=("Arial", 8), tags="text")
+                self.slots[b] = (rect, text, summary)
+            elif slot[2] != summary:
+                canvas.coords(slot[0], x1, self.start_y, x2, self.start_y + self.node_h)
+                canvas.coords(slot[1], (x1 + x2) / 2, mid_y)
+                canvas.itemconfig(slot[1], text=label)
+                self.slots[b] = (slot[0], slot[1], summary)
+        for rect, text, _ in spare:
+            canvas.delete(rect, text)
+
+        # One link between neighbouring blocks; the arrows inside a block are implied.
+        link_last = min(last, -(-n // k) - 1)
+        spare = [self.arrows.pop(b) for b in [b for b in self.arrows if not first <= b < link_last]]
+        for b in range(first, link_last):
+            if b in self.arrows:
+                continue
+            link_start_x = self.slot_x(b * k + k - 1) + self.node_w
+            link_end_x = self.slot_x(b * k + k)
+            if spare:
+                ids = spare.pop()
+                canvas.coords(ids[0], link_start_x, mid_y, link_end_x, mid_y)
+            else:
+                ids = [canvas.create_line(link_start_x, mid_y, link_end_x, mid_y, fill=theme["arrow_color"], tags="arrow")]
+            self.arrows[b] = ids
+        for ids in spare:
+            canvas.delete(*ids)
+
+        if n != self.length:
+            self.draw_decor(n, theme)
+            self.length = n
+
+    def draw_decor(self, n, theme):
+        canvas = self.canvas
+        canvas.delete(*self.decor)
+        self.decor = []
+        start_x, start_y, node_w, node_h = self.start_x, self.start_y, self.node_w, self.node_h
+
+        if not n and self.list_name != "Circular":
+            self.decor.append(canvas.create_text(self.empty_x, start_y + node_h // 2, text="EMPTY", anchor="w",
+                                                 fill=theme["fg"], font=("Arial", 10), tags="text"))
             return
 
-        for i, data in enumerate(nodes_data):
-            x1, y1 = current_x, start_y
-            x2, y2 = current_x + node_w, start_y + node_h
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=theme["node_fill"],
-                                         outline=theme["node_border"], width=1)
-            self.canvas.create_text(current_x + node_w / 2, start_y + node_h / 2, text=str(data),
-                                     fill=theme["fg"], font=("Arial", 10))
-            
-            if i < len(nodes_data) - 1:
-                arrow_start_x = x2
-                arrow_end_x = current_x + node_w + 30
-                self.canvas.create_line(arrow_start_x, start_y + node_h / 2,
-                                         arrow_end_x, start_y + node_h / 2,
-                                         arrow=tk.LAST, fill=theme["arrow_color"])
-                
-                if list_name == "Doubly":
-                    self.canvas.create_line(arrow_end_x, start_y + node_h / 2 + 5,
-                                             arrow_start_x, start_y + node_h / 2 + 5,
-                                             arrow=tk.LAST, fill=theme["arrow_color"])
-            
-            current_x += node_w + 30
-
-        if nodes_data:
-            last_node_x1 = current_x - (node_w + 30)
-            last_node_x2 = last_node_x1 + node_w
-            
-            if list_name in ["Singly", "Doubly"]:
-                self.canvas.create_text(last_node_x2 + 30, start_y + node_h / 2, text="NULL", anchor="w",
-                                         fill=theme["fg"], font=("Arial", 10))
-            
-            elif list_name == "Circular":
-                head_node_x = start_x + 50
-                last_node_end_x = last_node_x2
-                arrow_y = start_y + node_h / 2
-
-                p1_x, p1_y = last_node_end_x + 10, arrow_y
-                p2_x, p2_y = p1_x + 20, start_y + node_h + 20 
-                p3_x, p3_y = head_node_x - 20, p2_y
-                p4_x, p4_y = head_node_x - 10, start_y + node_h / 2
-                
-                self.canvas.create_line(p1_x, p1_y, p2_x, p2_y, p3_x, p3_y, p4_x, p4_y,
-
-                                         smooth=True, arrow=tk.LAST, fill=theme["arrow_color"])
+        head_x = self.slot_x(0)
+        self.decor.append(canvas.create_text(head_x - 30, start_y + node_h // 2, text="Head", anchor="e",
+                                             fill=theme["head_color"], font=("Arial", 10, "bold"), tags="head"))
+        if not n:
+            self.decor.append(canvas.create_text(head_x + node_w // 2, start_y + node_h // 2, text="EMPTY", anchor="center",
+                                                 fill=theme["fg"], font=("Arial", 10), tags="text"))
+            return
+
+        last_node_x2 = self.slot_x(n - 1) + node_w
+        if self.list_name in ["Singly", "Doubly"]:
+            self.decor.append(canvas.create_text(last_node_x2 + 30, start_y + node_h / 2, text="NULL", anchor="w",
+                                                 fill=theme["fg"], font=("Arial", 10), tags="text"))
+        else:
+            arrow_y = start_y + node_h / 2
+            p1_x, p1_y = last_node_x2 + 10, arrow_y
+            p2_x, p2_y = p1_x + 20, start_y + node_h + 20
+            p3_x, p3_y = head_x - 20, p2_y
+            p4_x, p4_y = head_x - 10, start_y + node_h / 2
+            self.decor.append(canvas.create_line(p1_x, p1_y, p2_x, p2_y, p3_x, p3_y, p4_x, p4_y,
+                                                 smooth=True, arrow=tk.LAST, fill=theme["arrow_color"], tags="arrow"))
@@ -0,0 +1,571 @@
+# list_pool.py
+
+from array import array
+from collections import Counter
+from itertools import islice
+
+NIL = -1 # Slot index used as the "None" link
+VALUE_RANGE = range(-2**63, 2**63) # What an array('q') slot can hold
+
+# --- Node Pool (Storage Engine) ---
+class NodePool:
+    """
+    Stores node fields in parallel array('q') buffers instead of one Python
+    object per node. A node is just an integer slot index into the buffers.
+    Released slots are threaded into a free-list through the `data` buffer
+    (a free slot has no value to keep) and handed out again before the
+    buffers grow. Links are left alone, so lists may swap `next`/`prev`.
+    """
+    def __init__(self, doubly=False):
+        self.data = array('q')
+        self.next = array('q')
+        self.prev = array('q') if doubly else None
+        self.free_head = NIL
+        self.in_use = 0
+
+    def alloc(self, value):
+        """Returns a slot holding `value` with its links set to NIL."""
+        slot = self.free_head
+        if slot != NIL:
+            next_free = self.data[slot]
+            self.data[slot] = value # Raises OverflowError before the free-list is touched
+            self.free_head = next_free
+            self.next[slot] = NIL
+            if self.prev is not None:
+                self.prev[slot] = NIL
+        else:
+            slot = len(self.data)
+            self.data.append(value)
+            self.next.append(NIL)
+            if self.prev is not None:
+                self.prev.append(NIL)
+        self.in_use += 1
+        return slot
+
+    def release(self, slot):
+        """Puts a slot back on the free-list."""
+        self.data[slot] = self.free_head
+        self.free_head = slot
+        self.in_use -= 1
+
+    def link_chain(self, iterable):
+        """
+        Allocates a slot per value, linked in order; returns (first, last, count).
+        The chain is not attached to anything, so if a value does not fit
+        (OverflowError) or the iterable raises, its slots are released and
+        the error propagates with no list changed.
+        """
+        alloc, nxt, prv = self.alloc, self.next, self.prev
+        first = last = NIL
+        count = 0
+        try:
+            for value in iterable:
+                slot = alloc(value)
+                if last != NIL:
+                    nxt[last] = slot
+                    if prv is not None:
+                        prv[slot] = last
+                else:
+                    first = slot
+                last = slot
+                count += 1
+        except BaseException:
+            slot = first
+            while slot != NIL:
+                following = nxt[slot]
+                self.release(slot)
+                slot = following
+            raise
+        return first, last, count
+
+    def nbytes(self):
+        """Bytes held by the buffers (including free slots)."""
+        total = self.data.itemsize * (len(self.data) + len(self.next))
+        if self.prev is not None:
+            total += self.prev.itemsize * len(self.prev)
+        return total
+
+# --- Pooled Linked List Classes (Data Models) ---
+class PooledSinglyLinkedList:
+    """SinglyLinkedList with the same API, backed by a NodePool. Values must be 64-bit ints."""
+    def __init__(self, app):
+        self.pool = NodePool()
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) != NIL
+    def __iter__(self):
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        while curr != NIL:
+            yield data[curr]
+            curr = nxt[curr]
+    def __reversed__(self):
+        return reversed(self.to_list())
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, without copying the list."""
+        start = max(start, 0)
+        return islice(self, start, start + max(count, 0))
+    def add_node(self, data):
+        slot = self.pool.alloc(data)
+        if self.head == NIL:
+            self.head = slot
+        else:
+            self.pool.next[self.tail] = slot
+        self.tail = slot
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        slot = self.pool.alloc(data)
+        self.pool.next[slot] = self.head
+        self.head = slot
+        if self.tail == NIL:
+            self.tail = slot
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first slot holding `key`, or NIL."""
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        while curr != NIL and data[curr] != key:
+            curr = nxt[curr]
+        return curr
+    def contains(self, key):
+        return self.find(key) != NIL
+    def delete_node(self, key):
+        data, nxt = self.pool.data, self.pool.next
+        prev = NIL
+        curr = self.head
+        while curr != NIL and data[curr] != key:
+            prev = curr
+            curr = nxt[curr]
+        if curr == NIL:
+            return False
+        if prev == NIL:
+            self.head = nxt[curr]
+        else:
+            nxt[prev] = nxt[curr]
+        if curr == self.tail:
+            self.tail = prev
+        self.pool.release(curr)
+        self.length -= 1
+        self.version += 1
+        return True
+    @classmethod
+    def from_iterable(cls, app, iterable):
+        linked_list = cls(app)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        if self.tail != NIL:
+            self.pool.next[self.tail] = first
+        else:
+            self.head = first
+        self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        self.pool.next[last] = self.head
+        self.head = first
+        if self.tail == NIL:
+            self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys):
+        """Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed."""
+        data, nxt = self.pool.data, self.pool.next
+        pending = Counter(keys)
+        removed = 0
+        prev = NIL
+        curr = self.head
+        while curr != NIL and pending:
+            next_slot = nxt[curr]
+            if pending.get(data[curr]):
+                pending[data[curr]] -= 1
+                if not pending[data[curr]]:
+                    del pending[data[curr]]
+                if prev == NIL:
+                    self.head = next_slot
+                else:
+                    nxt[prev] = next_slot
+                if curr == self.tail:
+                    self.tail = prev
+                self.pool.release(curr)
+                self.length -= 1
+                self.version += 1
+                removed += 1
+            else:
+                prev = curr
+            curr = next_slot
+        return removed
+    def reverse(self):
+        nxt = self.pool.next
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_slot = nxt[current]
+            nxt[current] = prev
+            prev = current
+            current = next_slot
+        self.head = prev
+        self.version += 1
+    def to_list(self):
+        data, nxt = self.pool.data, self.pool.next
+        nodes = []
+        curr = self.head
+        while curr != NIL:
+            nodes.append(data[curr])
+            curr = nxt[curr]
+        return nodes
+
+class PooledDoublyLinkedList:
+    """DoublyLinkedList with the same API, backed by a NodePool. Values must be 64-bit ints."""
+    def __init__(self, app):
+        self.pool = NodePool(doubly=True)
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) != NIL
+    def __iter__(self):
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        while curr != NIL:
+            yield data[curr]
+            curr = nxt[curr]
+    def __reversed__(self):
+        data, prv = self.pool.data, self.pool.prev
+        curr = self.tail
+        while curr != NIL:
+            yield data[curr]
+            curr = prv[curr]
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, walking in from the nearer end."""
+        data, nxt, prv = self.pool.data, self.pool.next, self.pool.prev
+        start = max(start, 0)
+        stop = min(start + count, self.length)
+        if start >= stop:
+            return
+        if start <= self.length - stop:
+            curr = self.head
+            for _ in range(start):
+                curr = nxt[curr]
+        else:
+            curr = self.tail
+            for _ in range(self.length - 1 - start):
+                curr = prv[curr]
+        for _ in range(stop - start):
+            yield data[curr]
+            curr = nxt[curr]
+    def add_node(self, data):
+        slot = self.pool.alloc(data)
+        if self.head == NIL:
+            self.head = slot
+        else:
+            self.pool.next[self.tail] = slot
+            self.pool.prev[slot] = self.tail
+        self.tail = slot
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        slot = self.pool.alloc(data)
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self.pool.prev[self.head] = slot
+        self.pool.next[slot] = self.head
+        self.head = slot
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first slot holding `key`, or NIL."""
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        while curr != NIL and data[curr] != key:
+            curr = nxt[curr]
+        return curr
+    def contains(self, key):
+        return self.find(key) != NIL
+    def delete_node(self, key):
+        data, nxt, prv = self.pool.data, self.pool.next, self.pool.prev
+        curr = self.head
+        while curr != NIL and data[curr] != key:
+            curr = nxt[curr]
+        if curr == NIL:
+            return False
+        before, after = prv[curr], nxt[curr]
+        if before != NIL:
+            nxt[before] = after
+        else:
+            self.head = after
+        if after != NIL:
+            prv[after] = before
+        else:
+            self.tail = before
+        self.pool.release(curr)
+        self.length -= 1
+        self.version += 1
+        return True
+    @classmethod
+    def from_iterable(cls, app, iterable):
+        linked_list = cls(app)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        if self.tail != NIL:
+            self.pool.next[self.tail] = first
+            self.pool.prev[first] = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        if self.head != NIL:
+            self.pool.prev[self.head] = last
+        else:
+            self.tail = last
+        self.pool.next[last] = self.head
+        self.head = first
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys):
+        """Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed."""
+        data, nxt, prv = self.pool.data, self.pool.next, self.pool.prev
+        pending = Counter(keys)
+        removed = 0
+        curr = self.head
+        while curr != NIL and pending:
+            next_slot = nxt[curr]
+            if pending.get(data[curr]):
+                pending[data[curr]] -= 1
+                if not pending[data[curr]]:
+                    del pending[data[curr]]
+                before = prv[curr]
+                if before != NIL:
+                    nxt[before] = next_slot
+                else:
+                    self.head = next_slot
+                if next_slot != NIL:
+                    prv[next_slot] = before
+                else:
+                    self.tail = before
+                self.pool.release(curr)
+                self.length -= 1
+                self.version += 1
+                removed += 1
+            curr = next_slot
+        return removed
+    def reverse(self):
+        # Swapping the two link buffers reverses every node at once.
+        self.pool.next, self.pool.prev = self.pool.prev, self.pool.next
+        self.head, self.tail = self.tail, self.head
+        self.version += 1
+    def to_list(self):
+        data, nxt = self.pool.data, self.pool.next
+        nodes = []
+        curr = self.head
+        while curr != NIL:
+            nodes.append(data[curr])
+            curr = nxt[curr]
+        return nodes
+
+class PooledCircularLinkedList:
+    """CircularLinkedList with the same API, backed by a NodePool. Values must be 64-bit ints."""
+    def __init__(self, app):
+        self.pool = NodePool()
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.version = 0 # Bumped by every mutation, so a view can tell an unchanged list
+        self.app = app
+    def __len__(self):
+        return self.length
+    def __contains__(self, key):
+        return self.find(key) != NIL
+    def __iter__(self):
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        for _ in range(self.length):
+            yield data[curr]
+            curr = nxt[curr]
+    def __reversed__(self):
+        return reversed(self.to_list())
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, without copying the list."""
+        start = max(start, 0)
+        return islice(self, start, start + max(count, 0))
+    def add_node(self, data):
+        slot = self.pool.alloc(data)
+        if self.head == NIL:
+            self.head = slot
+        else:
+            self.pool.next[self.tail] = slot
+        self.pool.next[slot] = self.head
+        self.tail = slot
+        self.length += 1
+        self.version += 1
+    def prepend_node(self, data):
+        slot = self.pool.alloc(data)
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self.pool.next[slot] = self.head
+        self.head = slot
+        self.pool.next[self.tail] = slot
+        self.length += 1
+        self.version += 1
+    def find(self, key):
+        """Returns the first slot (from head) holding `key`, or NIL."""
+        data, nxt = self.pool.data, self.pool.next
+        curr = self.head
+        for _ in range(self.length):
+            if data[curr] == key:
+                return curr
+            curr = nxt[curr]
+        return NIL
+    def contains(self, key):
+        return self.find(key) != NIL
+    def delete_node(self, key):
+        if self.head == NIL:
+            return False
+        data, nxt = self.pool.data, self.pool.next
+        prev = self.tail
+        curr = self.head
+        for _ in range(self.length):
+            if data[curr] == key:
+                break
+            prev = curr
+            curr = nxt[curr]
+        else:
+            return False
+        if nxt[curr] == curr:
+            self.head = NIL
+            self.tail = NIL
+        else:
+            nxt[prev] = nxt[curr]
+            if curr == self.head:
+                self.head = nxt[curr]
+            if curr == self.tail:
+                self.tail = prev
+        self.pool.release(curr)
+        self.length -= 1
+        self.version += 1
+        return True
+    @classmethod
+    def from_iterable(cls, app, iterable):
+        linked_list = cls(app)
+        linked_list.extend(iterable)
+        return linked_list
+    def extend(self, iterable):
+        """Appends every value in one pass; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        if self.tail != NIL:
+            self.pool.next[self.tail] = first
+        else:
+            self.head = first
+        self.pool.next[last] = self.head
+        self.tail = last
+        self.length += count
+        self.version += 1
+        return count
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order; returns how many were added."""
+        first, last, count = self.pool.link_chain(iterable)
+        if not count:
+            return 0
+        if self.tail == NIL:
+            self.tail = last
+            self.pool.next[last] = first
+        else:
+            self.pool.next[last] = self.head
+        self.head = first
+        self.pool.next[self.tail] = first
+        self.length += count
+        self.version += 1
+        return count
+    def delete_many(self, keys):
+        """Deletes the first occurrence of each key (duplicates count) in one pass; returns how many were removed."""
+        data, nxt = self.pool.data, self.pool.next
+        pending = Counter(keys)
+        removed = 0
+        prev = self.tail
+        curr = self.head
+        for _ in range(self.length):
+            if not pending:
+                break
+            next_slot = nxt[curr]
+            if pending.get(data[curr]):
+                pending[data[curr]] -= 1
+                if not pending[data[curr]]:
+                    del pending[data[curr]]
+                if next_slot == curr:
+                    self.head = NIL
+                    self.tail = NIL
+                else:
+                    nxt[prev] = next_slot
+                    if curr == self.head:
+                        self.head = next_slot
+                    if curr == self.tail:
+                        self.tail = prev
+                self.pool.release(curr)
+                self.length -= 1
+                self.version += 1
+                removed += 1
+            else:
+                prev = curr
+            curr = next_slot
+        return removed
+    def reverse(self):
+        if self.length < 2:
+            return
+        nxt = self.pool.next
+        prev = self.tail
+        current = self.head
+        for _ in range(self.length):
+            next_slot = nxt[current]
+            nxt[current] = prev
+            prev = current
+            current = next_slot
+        self.head, self.tail = self.tail, self.head
+        self.version += 1
+    def to_list(self):
+        data, nxt = self.pool.data, self.pool.next
+        nodes = []
+        curr = self.head
+        for _ in range(self.length):
+            nodes.append(data[curr])
+            curr = nxt[curr]
+        return nodes
@@ -0,0 +1,69 @@
+# log_buffer.py
+# GUI-free log model: a bounded line buffer with an optional rotating file sink.
+
+import time
+from collections import deque
+
+class LogBuffer:
+    """
+    Queues log lines until the next take_pending(), so a view can append
+    them in one batch. At most `max_lines` are queued; older ones drop off
+    the front, since a view that shows `max_lines` could never show them,
+    so memory stays bounded however long the session runs.
+
+    With a file sink open, every message is also put on a queue that a
+    background thread drains into rotating log files, so the caller never
+    waits on disk I/O.
+    """
+    def __init__(self, max_lines=1000):
+        self.pending = deque(maxlen=max_lines)
+        self.file_logger = None
+        self.file_listener = None
+
+    @property
+    def max_lines(self):
+        return self.pending.maxlen
+
+    def append(self, message):
+        """Timestamps `message`, queues it and returns the line."""
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        self.pending.append(line)
+        if self.file_logger is not None:
+            self.file_logger.info(message)
+        return line
+
+    def take_pending(self):
+        """Returns the lines added since the last call, oldest first."""
+        lines = list(self.pending)
+        self.pending.clear()
+        return lines
+
+    def open_file_sink(self, path, max_bytes=1_000_000, backup_count=3):
+        """Starts writing every message to `path`, rotated at `max_bytes` with `backup_count` old files."""
+        # logging.handlers costs more to import than the rest of core, and only this needs it.
+        import logging
+        import logging.handlers
+        import queue
+
+        self.close_file_sink()
+        records = queue.SimpleQueue()
+        # delay=True leaves opening the file to the listener thread's first write.
+        file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                            encoding="utf-8", delay=True)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        # A private logger, so nothing else in the process writes to this file.
+        logger = logging.Logger("visualizer.log_buffer", logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(records))
+        self.file_listener = logging.handlers.QueueListener(records, file_handler)
+        self.file_listener.start()
+        self.file_logger = logger
+
+    def close_file_sink(self):
+        """Writes out the queued messages and closes the file; a no-op without a sink."""
+        if self.file_listener is None:
+            return
+        self.file_logger = None
+        self.file_listener.stop()
+        for handler in self.file_listener.handlers:
+            handler.close()
+        self.file_listener = None
@@ -1,204 +1,20 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from PIL import Image, ImageTk
-import time
 import random
 import os
+import queue
+import threading
+from collections import Counter
 import pygame
 
+from core import LIST_ENGINES, CostStats, instrument, uninstrument, is_instrumented, LatencyRecorder, LogBuffer
+# The list models used to live here; keep them importable from main.
+from core import SLL_Node, SinglyLinkedList, DLL_Node, DoublyLinkedList, CLL_Node, CircularLinkedList
 from linkedlist_page import LinkedListPage
 from recursion_page import RecursionPage
 from stack_page import StackPage
 
-# --- Linked List Classes (Data Models) ---
-class SLL_Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-class SinglyLinkedList:
-    def __init__(self, app):
-        self.head = None
-        self.app = app
-    def add_node(self, data):
-        new_node = SLL_Node(data)
-        if not self.head:
-            self.head = new_node
-            return
-        last = self.head
-        while last.next:
-            last = last.next
-        last.next = new_node
-    def prepend_node(self, data):
-        new_node = SLL_Node(data)
-        new_node.next = self.head
-        self.head = new_node
-    def delete_node(self, key):
-        temp = self.head
-        if temp and temp.data == key:
-            self.head = temp.next
-            return True
-        prev = None
-        while temp and temp.data != key:
-            prev = temp
-            temp = temp.next
-        if not temp:
-            return False
-        prev.next = temp.next
-        return True
-    def reverse(self):
-        prev = None
-        current = self.head
-        while current:
-            next_node = current.next
-            current.next = prev
-            prev = current
-            current = next_node
-        self.head = prev
-    def to_list(self):
-        nodes = []
-        curr = self.head
-        while curr:
-            nodes.append(curr.data)
-            curr = curr.next
-        return nodes
-
-class DLL_Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-        self.prev = None
-class DoublyLinkedList:
-    def __init__(self, app):
-        self.head = None
-        self.app = app
-    def add_node(self, data):
-        new_node = DLL_Node(data)
-        if not self.head:
-            self.head = new_node
-            return
-        last = self.head
-        while last.next:
-            last = last.next
-        last.next = new_node
-        new_node.prev = last
-    def prepend_node(self, data):
-        new_node = DLL_Node(data)
-        if self.head:
-            self.head.prev = new_node
-        new_node.next = self.head
-        self.head = new_node
-    def delete_node(self, key):
-        curr = self.head
-        while curr and curr.data != key:
-            curr = curr.next
-        if not curr:
-            return False
-        if curr.prev:
-            curr.prev.next = curr.next
-        else:
-            self.head = curr.next
-        if curr.next:
-            curr.next.prev = curr.prev
-        return True
-    def reverse(self):
-        temp = None
-        current = self.head
-        while current:
-            temp = current.prev
-            current.prev = current.next
-            current.next = temp
-            current = current.prev
-        if temp:
-            self.head = temp.prev
-    def to_list(self):
-        nodes = []
-        curr = self.head
-        while curr:
-            nodes.append(curr.data)
-            curr = curr.next
-        return nodes
-
-class CLL_Node: 
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-class CircularLinkedList:
-    def __init__(self, app):
-        self.head = None
-        self.app = app
-    def add_node(self, data):
-        new_node = CLL_Node(data)
-        if not self.head:
-            self.head = new_node
-            new_node.next = self.head
-        else:
-            temp = self.head
-            while temp.next != self.head:
-                temp = temp.next
-            temp.next = new_node
-            new_node.next = self.head
-    def prepend_node(self, data):
-        new_node = CLL_Node(data)
-        if not self.head:
-            self.head = new_node
-            new_node.next = self.head
-        else:
-            temp = self.head
-            while temp.next != self.head:
-                temp = temp.next
-            temp.next = new_node
-            new_node.next = self.head
-            self.head = new_node
-    def delete_node(self, key):
-        if not self.head:
-            return False
-        curr = self.head
-        prev = None
-        while True:
-            if curr.data == key:
-                break
-            prev = curr
-            curr = curr.next
-            if curr == self.head:
-                return False
-        if curr == self.head:
-            if curr.next == self.head:
-                self.head = None
-            else:
-                last = self.head
-                while last.next != self.head:
-                    last = last.next
-                last.next = self.head.next
-                self.head = self.head.next
-        else:
-            prev.next = curr.next
-        return True
-    def reverse(self):
-        if not self.head or self.head.next == self.head:
-            return
-        temp_list = []
-        current = self.head
-        while True:
-            temp_list.append(current.data)
-            current = current.next
-            if current == self.head:
-                break
-        temp_list.reverse()
-        self.head = None
-        for data in temp_list:
-            self.add_node(data)
-    def to_list(self):
-        nodes = []
-        if not self.head:
-            return nodes
-        curr = self.head
-        while True:
-            nodes.append(curr.data)
-            curr = curr.next
-            if curr == self.head:
-                break
-        return nodes
-
 # --- GUI CLASSES ----------------------------------------------
 
 class SplashScreen(tk.Toplevel):
@@ -215,6 +31,10 @@ class SplashScreen(tk.Toplevel):
         self.fg_color = fg_color
         self.pil_image = None # To store original PIL image for glitching
         self.is_glitching = False
+        self.frame_delays = [] # Display time in ms of each frame in self.frames
+        self.frame_queue = queue.SimpleQueue() # ("frame", PIL image, ms) / ("error", message) / ("done", None) from the decoder
+        self.decoding = threading.Event() # Cleared to stop the decoder early
+        self.poll_id = self.animate_id = None
         
         self.config(bg=self.bg_color)
 
@@ -227,26 +47,58 @@ class SplashScreen(tk.Toplevel):
         else:
             self.handle_gif(content_path, self.image_size)
 
+    POLL_MS = 15 # How often the Tk thread collects decoded frames
+
     def handle_gif(self, gif_path, gif_size):
-        """Loads and prepares an animated GIF."""
+        """
+        Shows the splash at once with a blank image while a worker thread
+        decodes and resizes the GIF frames; they are picked up from
+        frame_queue as they arrive, and the animation starts with the first.
+        """
+        self.setup_ui(ImageTk.PhotoImage(Image.new("RGB", gif_size, self.bg_color)))
+        self.decoding.set()
+        threading.Thread(target=self.decode_gif, args=(gif_path, gif_size), daemon=True).start()
+        self.poll_id = self.after(self.POLL_MS, self.receive_frames)
+
+    def decode_gif(self, gif_path, gif_size):
+        """Worker thread: only PIL work here; PhotoImages must be made on the Tk thread."""
+        frame_queue = self.frame_queue
         try:
-            self.gif_image = Image.open(gif_path)
-            while True:
-                resized_frame = self.gif_image.copy().resize(gif_size, Image.Resampling.LANCZOS)
-                self.frames.append(ImageTk.PhotoImage(resized_frame))
-                self.gif_image.seek(len(self.frames))
+            with Image.open(gif_path) as gif_image:
+                index = 0
+                while self.decoding.is_set():
+                    gif_image.seek(index)
+                    resized_frame = gif_image.copy().resize(gif_size, Image.Resampling.LANCZOS)
+                    frame_queue.put(("frame", resized_frame, gif_image.info.get("duration", 90)))
+                    index += 1
         except EOFError:
             pass
         except FileNotFoundError:
-            self.create_error_placeholder(f"{os.path.basename(gif_path)} not found!")
+            frame_queue.put(("error", f"{os.path.basename(gif_path)} not found!"))
         except Exception as e:
-            self.create_error_placeholder(f"Error: {e}")
+            frame_queue.put(("error", f"Error: {e}"))
+        frame_queue.put(("done", None))
 
-        if self.frames:
-            self.setup_ui()
-            self.frame_count = len(self.frames)
-            if self.frame_count > 1:
-                self.animate()
+    def receive_frames(self):
+        """Turns the frames decoded so far into PhotoImages; polls again until the decoder is done."""
+        self.poll_id = None
+        while True:
+            try:
+                message = self.frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "frame":
+                self.frames.append(ImageTk.PhotoImage(message[1]))
+                self.frame_delays.append(50 if self.chosen_content == "teto.gif" else message[2])
+                if len(self.frames) == 1:
+                    self.label.config(image=self.frames[0])
+                    self.animate_id = self.after(self.frame_delays[0], self.animate)
+            elif message[0] == "error":
+                if not self.frames: # Otherwise keep animating the frames that did decode
+                    self.show_error(message[1])
+            else:
+                return
+        self.poll_id = self.after(self.POLL_MS, self.receive_frames)
 
     def handle_png(self, png_path, png_size):
         """Loads and prepares a static PNG."""
@@ -263,9 +115,10 @@ class SplashScreen(tk.Toplevel):
         if self.frames:
             self.setup_ui()
     
-    def setup_ui(self):
-        """Creates the common UI elements for the splash screen."""
-        self.label = tk.Label(self, image=self.frames[0], bg=self.bg_color, bd=0)
+    def setup_ui(self, image=None):
+        """Creates the common UI elements for the splash screen, showing `image` (default: the first frame)."""
+        self.label = tk.Label(self, image=image or self.frames[0], bg=self.bg_color, bd=0)
+        self.label.image = image # Keep a reference, or Tk drops the placeholder
         self.label.pack(padx=10, pady=(10, 5))
         self.group_label = tk.Label(
             self, 
@@ -292,6 +145,9 @@ class SplashScreen(tk.Toplevel):
         """Creates a placeholder in case an image fails to load."""
         self.frames.append(ImageTk.PhotoImage(Image.new("RGB", (100, 100), "#F0F0F0")))
         self.setup_ui()
+        self.show_error(error_text)
+
+    def show_error(self, error_text):
         self.label.config(text=error_text, image='', compound='center', height=6, width=20)
 
     def center_window(self):
@@ -304,16 +160,17 @@ class SplashScreen(tk.Toplevel):
         self.geometry(f'{width}x{height}+{x}+{y}')
 
     def animate(self):
-        """Cycles through the GIF frames"""
-        self.frame_index = (self.frame_index + 1) % self.frame_count
+        """Cycles through the GIF frames that have been decoded so far"""
+        self.frame_index = (self.frame_index + 1) % len(self.frames)
         self.label.config(image=self.frames[self.frame_index])
-        try:
-            delay = self.gif_image.info.get('duration', 90)
-            if self.chosen_content == "teto.gif":
-                delay = 50
-        except AttributeError:
-            delay = 100
-        self.after(delay, self.animate)
+        self.animate_id = self.after(self.frame_delays[self.frame_index], self.animate)
+
+    def destroy(self):
+        self.decoding.clear()
+        for after_id in (self.poll_id, self.animate_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        super().destroy()
 
     def shake(self, intensity=8):
         """
@@ -366,7 +223,18 @@ class SplashScreen(tk.Toplevel):
         self.is_glitching = False
 
 class MainApp(tk.Tk):
-    def __init__(self):
+    # Canvas tag -> {itemconfig option: theme key}; the pages tag every themed item with one of these roles
+    CANVAS_ROLES = {
+        "node": {"fill": "node_fill", "outline": "node_border"},
+        "top_node": {"fill": "accent", "outline": "node_border"},
+        "arrow": {"fill": "arrow_color"},
+        "head": {"fill": "head_color"},
+        "text": {"fill": "fg"},
+        "node_text": {"fill": "btn_fg"},
+        "latency_hud": {"fill": "accent"},
+    }
+
+    def __init__(self, list_engine="nodes", stack_backend="aggregate", log_lines=1000, log_file=None):
         super().__init__()
         self.title("Linked List Visualizer")
         self.geometry("1000x650")
@@ -374,9 +242,22 @@ class MainApp(tk.Tk):
         self.withdraw()
 
         # --- Data Models (Shared) ---
-        self.sll = SinglyLinkedList(self)
-        self.dll = DoublyLinkedList(self)
-        self.cll = CircularLinkedList(self)
+        self.list_classes = LIST_ENGINES[list_engine]
+        sll_class, dll_class, cll_class = self.list_classes
+        self.sll = sll_class(self)
+        self.dll = dll_class(self)
+        self.cll = cll_class(self)
+        self.stack_backend = stack_backend # Read by StackPage when it builds its Stack
+        self.cost_stats = None # CostStats while "Count Costs" is on; None keeps the models uninstrumented
+        self.latency = LatencyRecorder() # Per-action model/render/idle histograms
+        self.last_timed_action = {} # canvas -> name of the last action timed on it, for the HUD
+        self.idle_timings = [] # (timing, canvas) waiting for their idle lap
+
+        # --- Redraw scheduling ---
+        self.dirty_pages = {} # page -> timings waiting on its next paint
+        self.redraw_scheduled = False
+        self.redraw_requests = Counter() # page -> redraws requested
+        self.frame_counts = Counter() # page -> paints actually run
 
         # --- Theme/Style Management ---
         self.current_theme = "light"
@@ -393,6 +274,10 @@ class MainApp(tk.Tk):
             "arrow_color": "white", "head_color": "lightgreen", "log_bg": "#1C1C1C", "log_fg": "white"
         }
         self.theme = self.light_theme
+        self.themes = {"light": self.light_theme, "dark": self.dark_theme}
+        # Built once, so switching themes never recomputes a style or colour
+        self.style_sets = {name: self.build_style_set(theme) for name, theme in self.themes.items()}
+        self.role_colors = {name: self.build_role_colors(theme) for name, theme in self.themes.items()}
 
         self.style = ttk.Style(self)
         try:
@@ -404,6 +289,10 @@ class MainApp(tk.Tk):
         self.current_page_name = None # To track the active page
 
         self.log_text = None # Initialize log_text to None
+        self.log = LogBuffer(max_lines=log_lines) # The log widget never holds more than log_lines lines
+        self.log_flush_scheduled = False
+        if log_file:
+            self.log.open_file_sink(log_file)
         self.create_widgets()
         self.apply_theme(self.current_theme)
         
@@ -448,6 +337,25 @@ class MainApp(tk.Tk):
         self.dark_mode_btn = ttk.Button(self.themes_frame, text="Dark Mode", command=lambda: self.apply_theme("dark"))
         self.dark_mode_btn.pack(pady=5, fill=tk.X)
 
+        self.tools_frame = ttk.LabelFrame(self.bottom_frame, text="Tools", padding=10, style="Log.TLabelframe")
+        self.tools_frame.pack(side=tk.RIGHT, padx=5, pady=10, fill=tk.Y)
+        self.count_costs_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.tools_frame, text="Count Costs", variable=self.count_costs_var,
+                        command=self.toggle_cost_counting).pack(pady=5, fill=tk.X)
+        self.latency_hud_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.tools_frame, text="Latency HUD", variable=self.latency_hud_var,
+                        command=self.toggle_latency_hud).pack(pady=5, fill=tk.X)
+        ttk.Button(self.tools_frame, text="Export Latency...", command=self.export_latency).pack(pady=5, fill=tk.X)
+        ttk.Button(self.tools_frame, text="Frame Counts", command=self.log_frame_counts).pack(pady=5, fill=tk.X)
+        self.log_to_file_var = tk.BooleanVar(value=self.log.file_listener is not None)
+        ttk.Checkbutton(self.tools_frame, text="Log to File", variable=self.log_to_file_var,
+                        command=self.toggle_log_file).pack(pady=5, fill=tk.X)
+
+        # --- Undo/Redo shortcuts, routed to the visible page ---
+        self.bind("<Control-z>", lambda e: self.route_history("undo"))
+        self.bind("<Control-y>", lambda e: self.route_history("redo"))
+        self.bind("<Control-Shift-Z>", lambda e: self.route_history("redo"))
+
     def switch_page(self, page_name):
         """Hides the current page and shows the selected one, preserving state."""
         
@@ -470,22 +378,176 @@ class MainApp(tk.Tk):
         elif page_name == "stack":
             self.log_output("Switched to Stack view.")
 
-    def log_output(self, message):
-        """Adds a message to the log output area."""
-        if self.log_text:
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {message}\n")
-            self.log_text.see(tk.END)
-            self.log_text.config(state=tk.DISABLED)
+    def route_history(self, action):
+        """Sends an undo/redo shortcut to the current page, if it keeps a journal."""
+        handler = getattr(self.pages.get(self.current_page_name), action, None)
+        if handler:
+            handler(1)
+
+    def cost_models(self):
+        return [self.sll, self.dll, self.cll, self.pages["stack"].stack]
+
+    def toggle_cost_counting(self):
+        """Instruments the shared lists and the stack, or restores their plain classes."""
+        if self.count_costs_var.get():
+            self.cost_stats = CostStats()
+            for model in self.cost_models():
+                instrument(model, self.cost_stats)
+            self.log_output("Cost counting on: each operation logs its pointer hops, comparisons and allocations.")
         else:
-            print(f"[{time.strftime('%H:%M:%S')}] {message}")
+            for model in self.cost_models():
+                uninstrument(model)
+            self.cost_stats = None
+            self.log_output("Cost counting off.")
+
+    def replace_cost_model(self, old_model, new_model):
+        """Moves instrumentation to a model that replaced `old_model` (e.g. the persistent singly list)."""
+        if is_instrumented(old_model):
+            uninstrument(old_model)
+            instrument(new_model, self.cost_stats)
+
+    def measure_costs(self, label, action, *args):
+        """Runs action(*args); with cost counting on, logs its costs as one operation."""
+        if self.cost_stats is None:
+            return action(*args)
+        with self.cost_stats.measure(label):
+            result = action(*args)
+        self.log_output(CostStats.describe(self.cost_stats.last()))
+        return result
+
+    # --- Redraw scheduling ---
+    def request_redraw(self, page, timing=None):
+        """
+        Marks `page` dirty. Its update_representation runs once, in the next
+        idle callback, however many requests arrive before then. A `timing`
+        gets its render lap when that paint finishes.
+        """
+        self.redraw_requests[page] += 1
+        timings = self.dirty_pages.setdefault(page, [])
+        if timing is not None:
+            timings.append(timing)
+        if not self.redraw_scheduled:
+            self.redraw_scheduled = True
+            self.after_idle(self.flush_redraws)
+
+    def flush_redraws(self):
+        """Paints every dirty page once."""
+        self.redraw_scheduled = False
+        dirty_pages, self.dirty_pages = self.dirty_pages, {}
+        for page, timings in dirty_pages.items():
+            page.update_representation()
+            self.frame_counts[page] += 1
+            for timing in timings:
+                timing.lap("render")
+                self.finish_action(timing, page.canvas)
+
+    def redraw_stats(self):
+        """Returns {page name: (redraws requested, frames painted)}."""
+        return {name: (self.redraw_requests[page], self.frame_counts[page]) for name, page in self.pages.items()}
+
+    def log_frame_counts(self):
+        for name, (requests, frames) in self.redraw_stats().items():
+            self.log_output(f"{name.capitalize()} page: {requests} redraw request(s) painted in {frames} frame(s).")
+
+    # --- Latency histograms ---
+    def finish_action(self, timing, canvas):
+        """
+        Call after an action's model and render laps. The idle lap ends in an
+        after_idle callback, which Tk runs once the redraws queued by the
+        action have been flushed; the timing is recorded there.
+        """
+        self.idle_timings.append((timing, canvas))
+        if len(self.idle_timings) == 1:
+            self.after_idle(self._complete_actions)
+
+    def _complete_actions(self):
+        idle_timings, self.idle_timings = self.idle_timings, []
+        for timing, canvas in idle_timings:
+            timing.lap("idle")
+            timing.commit()
+            self.last_timed_action[canvas] = timing.action
+        if self.latency_hud_var.get():
+            for canvas in {canvas for _, canvas in idle_timings}:
+                self.draw_latency_hud(canvas)
+
+    def draw_latency_hud(self, canvas):
+        """Draws p50/p95/p99 per phase of the last action timed on `canvas` in its top-right corner."""
+        canvas.delete("latency_hud")
+        action = self.last_timed_action.get(canvas)
+        if not action:
+            return
+        lines = [f"{action}  (p50 / p95 / p99 ms)"]
+        for phase, (p50, p95, p99) in self.latency.percentiles(action).items():
+            lines.append(f"{phase:>6}: {p50 * 1e3:7.2f} {p95 * 1e3:7.2f} {p99 * 1e3:7.2f}")
+        x = canvas.canvasx(canvas.winfo_width()) - 10
+        y = canvas.canvasy(0) + 10
+        canvas.create_text(x, y, text="\n".join(lines), anchor="ne", justify=tk.LEFT,
+                           fill=self.theme["accent"], font=("Courier", 9), tags="latency_hud")
+        canvas.tag_raise("latency_hud")
+
+    def toggle_latency_hud(self):
+        for canvas in self.last_timed_action:
+            if self.latency_hud_var.get():
+                self.draw_latency_hud(canvas)
+            else:
+                canvas.delete("latency_hud")
+
+    def export_latency(self):
+        """Saves every latency histogram as JSON for offline comparison."""
+        path = filedialog.asksaveasfilename(title="Export Latency Histograms", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        self.latency.export_json(path)
+        self.log_output(f"Latency histograms for {len(self.latency.histograms)} action(s) saved to {path}.")
+
+    def log_output(self, message):
+        """Adds a message to the log; the log area shows it at the next frame, batched with any others."""
+        line = self.log.append(message)
+        if not self.log_text:
+            print(line)
+            return
+        if not self.log_flush_scheduled:
+            self.log_flush_scheduled = True
+            self.after_idle(self.flush_log)
+
+    def flush_log(self):
+        """Appends the pending lines in one widget update and trims the widget to the buffer's line cap."""
+        self.log_flush_scheduled = False
+        lines = self.log.take_pending()
+        if not lines:
+            return
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - self.log.max_lines
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+
+    def toggle_log_file(self):
+        """Starts or stops copying the log to rotating files, written by a background thread."""
+        if not self.log_to_file_var.get():
+            self.log.close_file_sink()
+            self.log_output("Stopped logging to file.")
+            return
+        path = filedialog.asksaveasfilename(title="Log to File", initialfile="visualizer.log", defaultextension=".log",
+                                            filetypes=[("Log", "*.log"), ("All files", "*")])
+        if not path:
+            self.log_to_file_var.set(False)
+            return
+        self.log.open_file_sink(path)
+        self.log_output(f"Logging to {path} (rotated at 1 MB, 3 old files kept).")
+
+    def destroy(self):
+        self.log.close_file_sink() # Writes out whatever the sink thread still has queued
+        super().destroy()
 
     def apply_theme(self, theme_name):
         """Applies the selected theme to all widgets."""
-        if theme_name == "light":
-            self.theme = self.light_theme
-        elif theme_name == "dark":
-            self.theme = self.dark_theme
+        if theme_name not in self.themes:
+            return
+        self.theme = self.themes[theme_name]
         self.current_theme = theme_name
 
         self.config(bg=self.theme["bg"])
@@ -505,45 +567,64 @@ class MainApp(tk.Tk):
                 page.apply_theme()
 
     def _configure_ttk_styles(self):
-        """Configures all ttk styles based on the current theme."""
-        self.style.configure("TFrame", background=self.theme["bg"])
-        self.style.configure("Main.TFrame", background=self.theme["bg"])
-        
-        self.style.configure("Control.TFrame", background=self.theme["bg"], relief="solid", borderwidth=1, bordercolor=self.theme["fg"])
-        self.style.configure("Representation.TFrame", background=self.theme["bg"], relief="solid", borderwidth=1, bordercolor=self.theme["fg"])
-        self.style.configure("Canvas.TFrame", background=self.theme["bg"], relief="sunken", borderwidth=2, bordercolor=self.theme["fg"])
-        self.style.configure("NotebookTab.TFrame", background=self.theme["bg"])
-
-        self.style.configure("TPanedwindow", background=self.theme["bg"])
-
-        self.style.configure("TLabel", background=self.theme["bg"], foreground=self.theme["fg"])
-        self.style.configure("Header.TLabel", background=self.theme["bg"], foreground=self.theme["fg"], font=("Arial", 14, "bold"))
-
-        self.style.configure("TLabelframe", background=self.theme["bg"], bordercolor=self.theme["fg"], relief="solid", borderwidth=1)
-        self.style.configure("TLabelframe.Label", foreground=self.theme["fg"], background=self.theme["bg"])
-        self.style.configure("Log.TLabelframe", background=self.theme["bg"], bordercolor=self.theme["fg"], relief="solid", borderwidth=1)
-        self.style.configure("Log.TLabelframe.Label", foreground=self.theme["fg"], background=self.theme["bg"])
-
-        self.style.configure("TButton", background=self.theme["btn_bg"], foreground=self.theme["btn_fg"],
-                             borderwidth=0, relief="flat", padding=5)
-        self.style.map("TButton",
-                        background=[('active', self.theme["accent_active"])],
-                        foreground=[('active', self.theme["btn_fg"])])
-
-        self.style.configure("TEntry", fieldbackground=self.theme["log_bg"], foreground=self.theme["log_fg"],
-                             insertcolor=self.theme["fg"], borderwidth=1, relief="solid")
-
-        self.style.configure("TNotebook", background=self.theme["bg"], borderwidth=0)
-        self.style.configure("TNotebook.Tab", background=self.theme["btn_bg"], foreground=self.theme["btn_fg"], padding=[10, 5])
-        
-        self.style.map("TNotebook.Tab",
-                        background=[("selected", self.theme["accent"]), ("active", self.theme["accent_active"])],
-                        foreground=[("selected", self.theme["btn_fg"]), ("active", self.theme["btn_fg"])]) 
-
-        self.style.configure("Vertical.TScrollbar", background=self.theme["btn_bg"], troughcolor=self.theme["bg"])
-        self.style.map("Vertical.TScrollbar", background=[('active', self.theme["accent_active"])])
-        self.style.configure("Horizontal.TScrollbar", background=self.theme["btn_bg"], troughcolor=self.theme["bg"])
-        self.style.map("Horizontal.TScrollbar", background=[('active', self.theme["accent_active"])])
+        """Configures all ttk styles from the precomputed style set of the current theme."""
+        for method, style, options in self.style_sets[self.current_theme]:
+            getattr(self.style, method)(style, **options)
+
+    @staticmethod
+    def build_style_set(theme):
+        """Returns the (method, style, options) calls that style every ttk widget for `theme`."""
+        return [
+            ("configure", "TFrame", dict(background=theme["bg"])),
+            ("configure", "Main.TFrame", dict(background=theme["bg"])),
+
+            ("configure", "Control.TFrame", dict(background=theme["bg"], relief="solid", borderwidth=1, bordercolor=theme["fg"])),
+            ("configure", "Representation.TFrame", dict(background=theme["bg"], relief="solid", borderwidth=1, bordercolor=theme["fg"])),
+            ("configure", "Canvas.TFrame", dict(background=theme["bg"], relief="sunken", borderwidth=2, bordercolor=theme["fg"])),
+            ("configure", "NotebookTab.TFrame", dict(background=theme["bg"])),
+
+            ("configure", "TPanedwindow", dict(background=theme["bg"])),
+
+            ("configure", "TLabel", dict(background=theme["bg"], foreground=theme["fg"])),
+            ("configure", "Header.TLabel", dict(background=theme["bg"], foreground=theme["fg"], font=("Arial", 14, "bold"))),
+
+            ("configure", "TLabelframe", dict(background=theme["bg"], bordercolor=theme["fg"], relief="solid", borderwidth=1)),
+            ("configure", "TLabelframe.Label", dict(foreground=theme["fg"], background=theme["bg"])),
+            ("configure", "Log.TLabelframe", dict(background=theme["bg"], bordercolor=theme["fg"], relief="solid", borderwidth=1)),
+            ("configure", "Log.TLabelframe.Label", dict(foreground=theme["fg"], background=theme["bg"])),
+
+            ("configure", "TButton", dict(background=theme["btn_bg"], foreground=theme["btn_fg"],
+                                          borderwidth=0, relief="flat", padding=5)),
+            ("map", "TButton", dict(background=[('active', theme["accent_active"])],
+                                    foreground=[('active', theme["btn_fg"])])),
+            # The pages mark their selected page button with this style
+            ("configure", "Accent.TButton", dict(background=theme["accent"], foreground=theme["btn_fg"])),
+            ("map", "Accent.TButton", dict(background=[('active', theme["accent_active"])])),
+
+            ("configure", "TEntry", dict(fieldbackground=theme["log_bg"], foreground=theme["log_fg"],
+                                         insertcolor=theme["fg"], borderwidth=1, relief="solid")),
+
+            ("configure", "TNotebook", dict(background=theme["bg"], borderwidth=0)),
+            ("configure", "TNotebook.Tab", dict(background=theme["btn_bg"], foreground=theme["btn_fg"], padding=[10, 5])),
+            ("map", "TNotebook.Tab", dict(background=[("selected", theme["accent"]), ("active", theme["accent_active"])],
+                                          foreground=[("selected", theme["btn_fg"]), ("active", theme["btn_fg"])])),
+
+            ("configure", "Vertical.TScrollbar", dict(background=theme["btn_bg"], troughcolor=theme["bg"])),
+            ("map", "Vertical.TScrollbar", dict(background=[('active', theme["accent_active"])])),
+            ("configure", "Horizontal.TScrollbar", dict(background=theme["btn_bg"], troughcolor=theme["bg"])),
+            ("map", "Horizontal.TScrollbar", dict(background=[('active', theme["accent_active"])])),
+        ]
+
+    @classmethod
+    def build_role_colors(cls, theme):
+        """Returns {canvas tag: itemconfig options} for `theme`."""
+        return {role: {option: theme[key] for option, key in options.items()}
+                for role, options in cls.CANVAS_ROLES.items()}
+
+    def recolor_canvas(self, canvas):
+        """Recolours every tagged item on `canvas` with one itemconfig per role, however many items there are."""
+        for role, options in self.role_colors[self.current_theme].items():
+            canvas.itemconfig(role, **options)
 
 # --- Main execution ---
 def main():
@@ -0,0 +1,218 @@
+# persistent_list.py
+
+from itertools import islice
+
+class PSLL_Node:
+    """Immutable cons cell: never modified after creation, so any number of versions can share it."""
+    __slots__ = ("data", "next")
+    def __init__(self, data, next_node=None):
+        self.data = data
+        self.next = next_node
+
+class PersistentSinglyLinkedList:
+    """
+    SinglyLinkedList API on immutable, structurally shared nodes.
+
+    Every mutation creates a new version that shares as much of the old
+    chain as it can: prepend shares the whole list, delete shares everything
+    after the removed node, and append/reverse copy the chain. A version is
+    just (head, length, label), so a snapshot costs O(1) and old versions
+    cost nothing until a mutation stops sharing their nodes.
+
+    Appends copy the whole chain, so N appends would keep O(N^2) nodes
+    alive. Only the newest `max_versions` versions are kept (None keeps
+    all); older ones are dropped and their unshared nodes freed. Version
+    ids keep counting up, so an id always names the same contents.
+    """
+    def __init__(self, app, max_versions=100):
+        self.app = app
+        self.max_versions = max_versions
+        self.versions = [(None, 0, "empty")]
+        self.first_version = 0 # Id of versions[0]; every older version was dropped
+        self.current = 0
+
+    @classmethod
+    def from_iterable(cls, app, iterable):
+        linked_list = cls(app)
+        linked_list.extend(iterable)
+        return linked_list
+
+    @property
+    def head(self):
+        return self.versions[self.current - self.first_version][0]
+
+    @property
+    def length(self):
+        return self.versions[self.current - self.first_version][1]
+
+    @property
+    def last_version(self):
+        return self.first_version + len(self.versions) - 1
+
+    @property
+    def version(self):
+        # Version ids are never reused for other contents, so the current id
+        # tells a view whether the list changed, including after a checkout.
+        return self.current
+
+    def __len__(self):
+        return self.versions[self.current - self.first_version][1]
+    def __contains__(self, key):
+        return self.find(key) is not None
+    def __iter__(self):
+        return self.iter_version(self.current)
+    def __reversed__(self):
+        return reversed(self.to_list())
+    def iter_range(self, start, count):
+        """Yields up to `count` values starting at position `start`, without copying the list."""
+        start = max(start, 0)
+        return islice(self, start, start + max(count, 0))
+
+    def _commit(self, head, length, label):
+        self.versions.append((head, length, label))
+        if self.max_versions is not None and len(self.versions) > self.max_versions:
+            excess = len(self.versions) - self.max_versions
+            del self.versions[:excess]
+            self.first_version += excess
+        self.current = self.last_version
+
+    # --- Mutations (each one commits a new version) ---
+    def add_node(self, data):
+        self.extend((data,))
+    def prepend_node(self, data):
+        self._commit(PSLL_Node(data, self.head), self.length + 1, f"prepend {data}")
+    def extend(self, iterable):
+        """Appends values; the existing chain has to be copied. Returns how many were added."""
+        tail_values = list(iterable)
+        if not tail_values:
+            return 0
+        head = None
+        for data in reversed(tail_values):
+            head = PSLL_Node(data, head)
+        head = self._copy_prefix(self.length, head)
+        label = f"append {tail_values[0]}" if len(tail_values) == 1 else f"append {len(tail_values)} values"
+        self._commit(head, self.length + len(tail_values), label)
+        return len(tail_values)
+    def prepend_all(self, iterable):
+        """Inserts the values in front of head, keeping their order and sharing the old list."""
+        values = list(iterable)
+        if not values:
+            return 0
+        head = self.head
+        for data in reversed(values):
+            head = PSLL_Node(data, head)
+        self._commit(head, self.length + len(values), f"prepend {len(values)} values")
+        return len(values)
+    def delete_node(self, key):
+        position = 0
+        curr = self.head
+        while curr and curr.data != key:
+            position += 1
+            curr = curr.next
+        if not curr:
+            return False
+        self._commit(self._copy_prefix(position, curr.next), self.length - 1, f"delete {key}")
+        return True
+    def delete_many(self, keys):
+        """Deletes the first occurrence of each key in one new version; returns how many were removed."""
+        pending = {}
+        for key in keys:
+            pending[key] = pending.get(key, 0) + 1
+        kept = []
+        removed = 0
+        for data in self:
+            if pending.get(data):
+                pending[data] -= 1
+                removed += 1
+            else:
+                kept.append(data)
+        if removed:
+            head = None
+            for data in reversed(kept):
+                head = PSLL_Node(data, head)
+            self._commit(head, len(kept), f"delete {removed} values")
+        return removed
+    def reverse(self):
+        head = None
+        for data in self:
+            head = PSLL_Node(data, head)
+        self._commit(head, self.length, "reverse")
+    def _copy_prefix(self, count, rest):
+        """Copies the first `count` nodes of the current version onto `rest`."""
+        prefix = list(self.iter_range(0, count))
+        for data in reversed(prefix):
+            rest = PSLL_Node(data, rest)
+        return rest
+
+    # --- Queries ---
+    def find(self, key):
+        """Returns the first node holding `key`, or None."""
+        curr = self.head
+        while curr and curr.data != key:
+            curr = curr.next
+        return curr
+    def contains(self, key):
+        return self.find(key) is not None
+    def to_list(self):
+        return list(self)
+
+    # --- Versions ---
+    def snapshot(self):
+        """Returns the id of the current version. O(1): versions are never modified."""
+        return self.current
+    def list_versions(self):
+        """Returns (version id, label, length) for every kept version, oldest first."""
+        return [(version, label, length)
+                for version, (_, length, label) in enumerate(self.versions, start=self.first_version)]
+    def has_version(self, version):
+        """True if `version` exists and has not been dropped."""
+        return self.first_version <= version <= self.last_version
+    def version_entry(self, version):
+        """Returns (head, length, label) of a kept version."""
+        if not self.has_version(version):
+            raise IndexError(f"No version {version}.")
+        return self.versions[version - self.first_version]
+    def iter_version(self, version):
+        curr = self.version_entry(version)[0]
+        while curr:
+            yield curr.data
+            curr = curr.next
+    def checkout(self, version):
+        """Makes `version` current without creating a new one (used for scrubbing)."""
+        if not self.has_version(version):
+            raise IndexError(f"No version {version}.")
+        self.current = version
+    def restore(self, version):
+        """Commits a new version equal to `version`; history is kept. O(1)."""
+        head, length, _ = self.version_entry(version)
+        self._commit(head, length, f"restore v{version}")
+    def diff(self, old_version, new_version):
+        """
+        Compares two versions using their shared suffix: walks only the
+        nodes the versions do not share, not the whole lists. Mutations copy
+        the nodes in front of a change, so the unshared runs are then trimmed
+        of the values they start and end with in common. Returns a dict with
+        the "removed" values (only in old), "added" values (only in new) and
+        the "shared" node count.
+        """
+        old_head, old_len, _ = self.version_entry(old_version)
+        new_head, new_len, _ = self.version_entry(new_version)
+        removed, added = [], []
+        while old_len > new_len:
+            removed.append(old_head.data)
+            old_head, old_len = old_head.next, old_len - 1
+        while new_len > old_len:
+            added.append(new_head.data)
+            new_head, new_len = new_head.next, new_len - 1
+        while old_head is not new_head:
+            removed.append(old_head.data)
+            added.append(new_head.data)
+            old_head, new_head = old_head.next, new_head.next
+            old_len -= 1
+        start = 0
+        while start < len(removed) and start < len(added) and removed[start] == added[start]:
+            start += 1
+        end_removed, end_added = len(removed), len(added)
+        while end_removed > start and end_added > start and removed[end_removed - 1] == added[end_added - 1]:
+            end_removed, end_added = end_removed - 1, end_added - 1
+        return {"removed": removed[start:end_removed], "added": added[start:end_added], "shared": old_len}
@@ -45,6 +45,7 @@ class RecursionPage(ttk.Frame):
 
         # Apply theme immediately on creation
         self.apply_theme()
+        self.update_representation()
 
     def create_control_widgets(self):
         """Creates the controls for the left panel."""
@@ -172,16 +173,9 @@ class RecursionPage(ttk.Frame):
     def apply_theme(self):
         """Applies the current theme from main_app to this page's widgets."""
         theme = self.main_app.theme
-
-        self.main_app.style.configure("Accent.TButton",
-                                      background=theme["accent"],
-                                      foreground=theme["btn_fg"])
-        self.main_app.style.map("Accent.TButton",
-                                background=[('active', theme["accent_active"])])
-
         self.canvas.config(bg=theme["canvas_bg"])
         self.canvas_h_scroll.config(style="Horizontal.TScrollbar")
-        self.update_representation() 
+        self.main_app.recolor_canvas(self.canvas)
 
     def run_recursion(self, mode):
         """Simulates and visualizes a recursion function sequence."""
@@ -193,6 +187,7 @@ class RecursionPage(ttk.Frame):
             messagebox.showerror("Input Error", "Please enter a number between 1 and 10 for the elements.")
             return
         
+        timing = self.main_app.latency.start(f"{mode} recursion")
         self.last_status_text = None
         self.canvas.delete("status_text")
 
@@ -219,6 +214,8 @@ class RecursionPage(ttk.Frame):
         # Set initial status text
         self.last_status_text = "Cooked Burgers Serving . . ." if mode == "head" else "Patrick is Eating the Burgers . . ."
 
+        timing.lap("model")
+
         # Clear any pending animations
         if hasattr(self, '_animation_job_id'):
             self.after_cancel(self._animation_job_id)
@@ -239,6 +236,9 @@ class RecursionPage(ttk.Frame):
             self.canvas.delete("all") # Clear canvas first            
             self.update_representation(mode, stack_data, draw_burgers=True) # Draw all burgers
             self.start_patrick_eating_sequence() # Patrick eats them one by one
+        # Only the first frame is timed; the animations run later from after() callbacks.
+        timing.lap("render")
+        self.main_app.finish_action(timing, self.canvas)
 
     def update_representation(self, mode=None, stack_data=None, draw_burgers=True):
         """Draws the sequence frames horizontally on the canvas."""
@@ -258,7 +258,7 @@ class RecursionPage(ttk.Frame):
             else:
                 # If still no data, display initial message
                 self.canvas.create_text(10, 10, text="Run Tail or Head Recursion to view the sequence.",
-                                         anchor="nw", fill=theme["fg"], font=("Arial", 12))
+                                         anchor="nw", fill=theme["fg"], font=("Arial", 12), tags="text")
                 self.canvas.config(scrollregion=(0,0,1,1)) # Reset scrollregion
                 return
 
@@ -275,7 +275,7 @@ class RecursionPage(ttk.Frame):
 
         self.canvas.create_text(x_start, y_start - 30,
                                  text=title_text, anchor="nw",
-                                 fill=theme["fg"], font=("Arial", 12, "bold"), tags="status_text")
+                                 fill=theme["fg"], font=("Arial", 12, "bold"), tags=("status_text", "text"))
 
         for i, (call_num, value, order) in enumerate(stack_data):
             center_x = x_start + i * (frame_w + x_spacing) + frame_w / 2
@@ -288,8 +288,8 @@ class RecursionPage(ttk.Frame):
                 else:
                     x1, y1 = center_x - frame_w / 2, center_y - frame_h / 2
                     x2, y2 = center_x + frame_w / 2, center_y + frame_h / 2
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill=theme["node_fill"], outline=theme["node_border"], width=1)
-                    self.canvas.create_text(center_x, center_y, text=value, anchor="center", fill=theme["fg"], font=("Arial", 14, "bold"))
+                    self.canvas.create_rectangle(x1, y1, x2, y2, fill=theme["node_fill"], outline=theme["node_border"], width=1, tags="node")
+                    self.canvas.create_text(center_x, center_y, text=value, anchor="center", fill=theme["fg"], font=("Arial", 14, "bold"), tags="text")
 
         # Update scrollregion for horizontal scrolling
         bbox = self.canvas.bbox("all")
@@ -0,0 +1,215 @@
+# stack_models.py
+# GUI-free stack models; importable without tkinter, PIL or pygame.
+
+from array import array
+
+# --- Custom Stack Exceptions ---
+class StackOverflowError(Exception):
+    """Exception raised for errors when stack is full."""
+    pass
+
+class StackUnderflowError(Exception):
+    """Exception raised for errors when stack is empty."""
+    pass
+
+class Stack:
+    """A simple LIFO stack implementation."""
+    def __init__(self, capacity=10):
+        self._items = []
+        self.capacity = capacity
+        # value -> ascending list of the indices holding it; the last
+        # entry is the top-most copy, which is also the next one popped.
+        self._positions = {}
+    
+    def push(self, item):
+        if len(self._items) >= self.capacity:
+            raise StackOverflowError("Stack is full. Cannot push.")
+        positions = self._positions.get(item)
+        if positions is None:
+            self._positions[item] = [len(self._items)]
+        else:
+            positions.append(len(self._items))
+        self._items.append(item)
+    
+    def pop(self):
+        if self.is_empty():
+            raise StackUnderflowError("Stack is empty. Cannot pop.")
+        item = self._items.pop()
+        positions = self._positions[item]
+        positions.pop()
+        if not positions:
+            del self._positions[item]
+        return item
+        
+    def peek(self):
+        if not self.is_empty():
+            return self._items[-1]
+        return None
+    
+    def is_empty(self):
+        return len(self._items) == 0
+    
+    def size(self):
+        return len(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        """Iterates from the bottom of the stack to the top."""
+        return iter(self._items)
+
+    def __reversed__(self):
+        """Iterates from the top of the stack to the bottom."""
+        return reversed(self._items)
+
+    def iter_range(self, start, count):
+        """Yields up to `count` items from bottom-based position `start`, without copying."""
+        items = self._items
+        start = max(start, 0)
+        for i in range(start, min(start + count, len(items))):
+            yield items[i]
+        
+    def to_list(self):
+        return list(self._items)
+
+    def search(self, item):
+        """
+        Searches for an item and returns its 1-based position from the top.
+        The top of the stack is position 1.
+        Returns None if the item is not found.
+        """
+        positions = self._positions.get(item)
+        if not positions:
+            return None
+        # self._items are stored with the bottom at index 0 and top at -1.
+        return len(self._items) - positions[-1]
+
+    def count(self, item):
+        """Returns how many copies of `item` are on the stack."""
+        return len(self._positions.get(item, ()))
+
+    def __contains__(self, item):
+        return item in self._positions
+
+class AggregateStack(Stack):
+    """
+    Stack that also answers min/max/sum in O(1). Alongside `_items` it keeps
+    the running minimum, maximum and sum at every depth, so a pop just drops
+    the last entry of each and the previous aggregates are already there.
+    """
+    def __init__(self, capacity=10):
+        super().__init__(capacity)
+        self._mins = []
+        self._maxs = []
+        self._sums = []
+
+    def push(self, item):
+        super().push(item)
+        if self._sums:
+            self._mins.append(min(item, self._mins[-1]))
+            self._maxs.append(max(item, self._maxs[-1]))
+            self._sums.append(self._sums[-1] + item)
+        else:
+            self._mins.append(item)
+            self._maxs.append(item)
+            self._sums.append(item)
+
+    def pop(self):
+        item = super().pop()
+        self._mins.pop()
+        self._maxs.pop()
+        self._sums.pop()
+        return item
+
+    def minimum(self):
+        return self._mins[-1] if self._mins else None
+
+    def maximum(self):
+        return self._maxs[-1] if self._maxs else None
+
+    def total(self):
+        return self._sums[-1] if self._sums else 0
+
+class ArrayStack:
+    """
+    LIFO stack on a typed array preallocated to `capacity` slots.
+
+    Items live unboxed in the buffer (8 bytes each for the default "q"
+    typecode), push/pop only move the top index and never allocate, and
+    view() exposes the live items as a read-only memoryview so renderers
+    and exporters can read them without copying. Items must fit the
+    typecode, e.g. "q" for 64-bit ints, "i"/"h"/"b" for smaller ints or
+    "d" for floats.
+    """
+    def __init__(self, capacity=10, typecode="q"):
+        self._buffer = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._top = 0
+        self.capacity = capacity
+
+    def push(self, item):
+        if self._top >= self.capacity:
+            raise StackOverflowError("Stack is full. Cannot push.")
+        self._buffer[self._top] = item
+        self._top += 1
+
+    def pop(self):
+        if self.is_empty():
+            raise StackUnderflowError("Stack is empty. Cannot pop.")
+        self._top -= 1
+        return self._buffer[self._top]
+
+    def peek(self):
+        if not self.is_empty():
+            return self._buffer[self._top - 1]
+        return None
+
+    def is_empty(self):
+        return self._top == 0
+
+    def size(self):
+        return self._top
+
+    def __len__(self):
+        return self._top
+
+    def __iter__(self):
+        """Iterates from the bottom of the stack to the top."""
+        return iter(self.view())
+
+    def __reversed__(self):
+        """Iterates from the top of the stack to the bottom."""
+        buffer = self._buffer
+        for i in range(self._top - 1, -1, -1):
+            yield buffer[i]
+
+    def iter_range(self, start, count):
+        """Yields up to `count` items from bottom-based position `start`, without copying."""
+        start = max(start, 0)
+        return iter(self.view()[start:start + max(count, 0)])
+
+    def view(self):
+        """Returns a read-only, zero-copy memoryview of the items, bottom first."""
+        return memoryview(self._buffer)[:self._top].toreadonly()
+
+    def to_list(self):
+        return self._buffer[:self._top].tolist()
+
+    def search(self, item):
+        """
+        Searches for an item and returns its 1-based position from the top.
+        The top of the stack is position 1.
+        Returns None if the item is not found.
+        """
+        buffer = self._buffer
+        for position, i in enumerate(range(self._top - 1, -1, -1), start=1):
+            if buffer[i] == item:
+                return position
+        return None
+
+# Backends selectable through MainApp(stack_backend=...)
+STACK_BACKENDS = {
+    "list": Stack,
+    "aggregate": AggregateStack,
+    "array": ArrayStack,
+}
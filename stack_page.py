@@ -5,63 +5,20 @@ from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 import os
 
-# --- Custom Stack Exceptions ---
-class StackOverflowError(Exception):
-    """Exception raised for errors when stack is full."""
-    pass
-
-class StackUnderflowError(Exception):
-    """Exception raised for errors when stack is empty."""
-    pass
-
-class Stack:
-    """A simple LIFO stack implementation."""
-    def __init__(self, capacity=10):
-        self._items = []
-        self.capacity = capacity
-    
-    def push(self, item):
-        if len(self._items) >= self.capacity:
-            raise StackOverflowError("Stack is full. Cannot push.")
-        self._items.append(item)
-    
-    def pop(self):
-        if self.is_empty():
-            raise StackUnderflowError("Stack is empty. Cannot pop.")
-        return self._items.pop()
-        
-    def peek(self):
-        if not self.is_empty():
-            return self._items[-1]
-        return None
-    
-    def is_empty(self):
-        return len(self._items) == 0
-    
-    def size(self):
-        return len(self._items)
-        
-    def to_list(self):
-        return list(self._items)
-
-    def search(self, item):
-        """
-        Searches for an item and returns its 1-based position from the top.
-        The top of the stack is position 1.
-        Returns None if the item is not found.
-        """
-        try:
-            # self._items are stored with the bottom at index 0 and top at -1.
-            # We reverse it to search from the top.
-            return self._items[::-1].index(item) + 1
-        except ValueError:
-            return None
+from core import OperationJournal
+from core import StackOverflowError, StackUnderflowError, STACK_BACKENDS
+from core import Stack # Re-exported: Stack used to be defined here
 
 class StackPage(ttk.Frame):
     def __init__(self, parent_container, main_app):
         super().__init__(parent_container, style="Main.TFrame")
         self.main_app = main_app
-        self.stack = Stack(capacity=10)
+        self.stack = STACK_BACKENDS[main_app.stack_backend](capacity=10)
+        # Canvas items kept between paints (see update_representation)
+        self.blocks = [] # (rect id, text id, value) per stack position, bottom first
+        self.dirty_from = 0 # Lowest stack position changed since the last paint
+        self.header = self.empty_text = self.top_marker = None
+        self.journal = OperationJournal(max_history=1000)
         
         # --- Create the Left/Right split ---
         self.horizontal_paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -84,6 +41,7 @@ class StackPage(ttk.Frame):
 
         # Apply theme immediately on creation
         self.apply_theme()
+        self.update_representation()
 
     def create_control_widgets(self):
         """Creates the controls for the left panel."""
@@ -121,6 +79,15 @@ class StackPage(ttk.Frame):
         ttk.Button(action_btn_frame, text="Peek", command=self.peek_node).pack(side=tk.LEFT, padx=2)
         ttk.Button(action_btn_frame, text="Search", command=self.search_node).pack(side=tk.LEFT, padx=2)
 
+        # --- Undo/Redo (Ctrl+Z / Ctrl+Y undo or redo one step) ---
+        history_frame = ttk.Frame(self.control_panel)
+        history_frame.pack(pady=(0, 10))
+        ttk.Button(history_frame, text="Undo", command=lambda: self.undo(self.get_history_steps())).pack(side=tk.LEFT, padx=2)
+        ttk.Button(history_frame, text="Redo", command=lambda: self.redo(self.get_history_steps())).pack(side=tk.LEFT, padx=2)
+        ttk.Label(history_frame, text="Steps:").pack(side=tk.LEFT, padx=(8, 2))
+        self.history_steps_var = tk.StringVar(value="1")
+        ttk.Spinbox(history_frame, from_=1, to=1000, width=5, textvariable=self.history_steps_var).pack(side=tk.LEFT)
+
         self.size_btn_var = tk.StringVar(value=f"No. of Elements in the Stack: {self.stack.size()}")
         ttk.Button(self.control_panel, textvariable=self.size_btn_var, command=self.show_size).pack(fill=tk.X, padx=10, pady=15)
         
@@ -145,17 +112,9 @@ class StackPage(ttk.Frame):
     def apply_theme(self):
         """Applies the current theme from main_app to this page's widgets."""
         theme = self.main_app.theme
-        
-        # Define a new style for the active button
-        self.main_app.style.configure("Accent.TButton", 
-                                      background=theme["accent"], 
-                                      foreground=theme["btn_fg"])
-        self.main_app.style.map("Accent.TButton",
-                                background=[('active', theme["accent_active"])])
-
         self.canvas.config(bg=theme["canvas_bg"])
         self.canvas_v_scroll.config(style="Vertical.TScrollbar")
-        self.update_representation() # Redraw canvas
+        self.main_app.recolor_canvas(self.canvas)
 
     def push_node(self):
         value = self.node_value_var.get()
@@ -164,26 +123,35 @@ class StackPage(ttk.Frame):
             return
         
         try:
-            self.stack.push(int(value)) # Convert to int before pushing
+            timing = self.main_app.latency.start("push")
+            self.main_app.measure_costs("push", self.journal.push, self.stack, int(value)) # Convert to int before pushing
+            self.mark_changed(len(self.stack) - 1)
             self.node_value_var.set("")
             self.main_app.log_output(f"Pushed {value} onto the stack.")
-            self.update_representation()
+            timing.lap("model")
+            self.main_app.request_redraw(self, timing)
         except StackOverflowError as e:
             self.main_app.log_output(f"Failed to Push: {e}")
             self.show_error_image_window("Stack Overflow", str(e), self.overflow_img_tk)
+        except OverflowError: # The array backend's typecode cannot hold the value; nothing was pushed
+            self.main_app.log_output(f"Failed to Push: {value} does not fit the array stack's item type.")
+            messagebox.showwarning("Input Error", f"{value} is too large for the array stack's item type.")
 
     def pop_node(self):
         try:
-            popped_value = self.stack.pop()
+            timing = self.main_app.latency.start("pop")
+            popped_value = self.main_app.measure_costs("pop", self.journal.pop, self.stack)
+            self.mark_changed(len(self.stack))
             self.main_app.log_output(f"Popped {popped_value} from the stack.")
-            self.update_representation()
+            timing.lap("model")
+            self.main_app.request_redraw(self, timing)
         except StackUnderflowError as e:
             self.main_app.log_output(f"Failed to Pop: {e}")
             self.show_error_image_window("Stack Underflow", str(e), self.underflow_img_tk)
 
     def peek_node(self):
         try:
-            peek_value = self.stack.peek()
+            peek_value = self.main_app.measure_costs("peek", self.stack.peek)
             messagebox.showinfo("Peek Result", f"The top element is {peek_value}.")
             self.main_app.log_output(f"Peeked: Top element is {peek_value}.")
         except StackUnderflowError:
@@ -197,7 +165,7 @@ class StackPage(ttk.Frame):
             messagebox.showwarning("Input Error", "Please enter a value to search for.")
             return
 
-        position = self.stack.search(int(value)) # Convert to int for searching
+        position = self.main_app.measure_costs("search", self.stack.search, int(value)) # Convert to int for searching
 
         if position is not None:
             messagebox.showinfo("Search Result", f"Element {value} found at position {position} from the top.")
@@ -206,56 +174,124 @@ class StackPage(ttk.Frame):
             messagebox.showinfo("Search Result", f"Element {value} not found in the stack.")
             self.main_app.log_output(f"Search: '{value}' not found.")
 
+    def get_history_steps(self):
+        """Returns the Undo/Redo step count from the spinbox (at least 1)."""
+        try:
+            return max(1, int(self.history_steps_var.get()))
+        except ValueError:
+            return 1
+
+    def undo(self, steps=1):
+        """Undoes up to `steps` pushes/pops, then redraws once."""
+        size = len(self.stack)
+        done = self.journal.undo(steps)
+        if done:
+            self.mark_changed(size - done) # Each step moves the top by one, so nothing lower changed
+            self.main_app.log_output(f"Undid {done} stack operation(s).")
+            self.main_app.request_redraw(self)
+        else:
+            self.main_app.log_output("Nothing to undo.")
+
+    def redo(self, steps=1):
+        """Redoes up to `steps` undone pushes/pops, then redraws once."""
+        size = len(self.stack)
+        done = self.journal.redo(steps)
+        if done:
+            self.mark_changed(size - done)
+            self.main_app.log_output(f"Redid {done} stack operation(s).")
+            self.main_app.request_redraw(self)
+        else:
+            self.main_app.log_output("Nothing to redo.")
+
     def show_size(self):
         size = self.stack.size()
         self.size_btn_var.set(f"No. of Elements in the Stack: {size}")
         self.main_app.log_output(f"Stack size checked: {size} elements.")
 
+    FRAME_W, FRAME_H = 250, 40
+    X_START, Y_START = 50, 40
+    Y_SPACING = 5
+
+    def slot_y(self, position):
+        """Top edge of the block for bottom-based `position`; the bottom of the stack sits in the lowest slot."""
+        return self.Y_START + (self.stack.capacity - 1 - position) * (self.FRAME_H + self.Y_SPACING)
+
+    def mark_changed(self, position):
+        """Records that stack positions from `position` up may differ from the drawn blocks."""
+        self.dirty_from = min(self.dirty_from, max(position, 0))
+
     def update_representation(self):
-        """Draws the stack blocks on the canvas (LIFO: blocks stacked vertically)."""
-        self.canvas.delete("all")
-        self.show_size() 
+        """
+        Brings the stack blocks (LIFO, top block highest) up to date. Every
+        position has a fixed slot, so only the positions changed since the
+        last paint are redrawn: a push or pop costs a constant number of
+        canvas operations however full the stack is.
+        """
+        canvas = self.canvas
         theme = self.main_app.theme
-        
-        items = self.stack.to_list()
-        capacity = self.stack.capacity
-        frame_w, frame_h = 250, 40
-        x_start, y_start = 50, 30
-        y_spacing = 5
-        
-        self.canvas.create_text(x_start, 10, text=f"Capacity: {len(items)} / {capacity}", anchor="nw", fill=theme["fg"], font=("Arial", 10))
-
-        if not items:
-             self.canvas.create_text(x_start, y_start, text="The Stack is Empty.", 
-                                      anchor="nw", fill=theme["fg"], font=("Arial", 12))
-             bbox = self.canvas.bbox("all")
-             self.canvas.config(scrollregion=bbox if bbox else (0, 0, 1, 1))
-             return
-
-        # Draw from bottom (index 0) to top (index -1)
-        # We reverse the items so the "top" of the stack is at the top of the drawing
-        for i, data in enumerate(reversed(items)):
-            y_pos = y_start + i * (frame_h + y_spacing)
-            x1, y1 = x_start, y_pos
-            x2, y2 = x1 + frame_w, y1 + frame_h
-            
-            fill_color = theme["node_fill"]
-            if i == 0: # This is the top-most item
-                fill_color = theme["accent"] 
-                self.canvas.create_text(x2 + 10, y1 + frame_h / 2, text="<-- TOP / PEEK", 
-                                         anchor="w", fill=theme["head_color"], font=("Arial", 10, "bold"))
-
-            self.canvas.create_rectangle(x1, y1, x2, y2, 
-                                         fill=fill_color, outline=theme["node_border"], width=1)
-            
-            self.canvas.create_text(x1 + frame_w / 2, y1 + frame_h / 2, text=str(data), 
-                                     anchor="center", fill=theme["btn_fg"], font=("Arial", 10, "bold"))
-            
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            self.canvas.config(scrollregion=(0, 0, bbox[2] + 150, bbox[3] + 50)) # Add padding
-        else:
-            self.canvas.config(scrollregion=(0, 0, 1, 1))
+        size = len(self.stack)
+        self.size_btn_var.set(f"No. of Elements in the Stack: {size}")
+        if self.header is None:
+            self.create_stack_frame(theme)
+
+        header = f"Capacity: {size} / {self.stack.capacity}"
+        if size and hasattr(self.stack, "minimum"):
+            header += f"    Min: {self.stack.minimum()}    Max: {self.stack.maximum()}    Sum: {self.stack.total()}"
+        canvas.itemconfig(self.header, text=header)
+        canvas.itemconfig(self.empty_text, state="normal" if not size else "hidden")
+
+        blocks = self.blocks
+        old_top = len(blocks) - 1
+        first = min(self.dirty_from, size, len(blocks))
+        self.dirty_from = size
+        while len(blocks) > size:
+            rect, text, _ = blocks.pop()
+            canvas.delete(rect, text)
+        x1, x2 = self.X_START, self.X_START + self.FRAME_W
+        for i, data in enumerate(self.stack.iter_range(first, size - first), start=first):
+            if i < len(blocks):
+                rect, text, value = blocks[i]
+                if value != data:
+                    canvas.itemconfig(text, text=str(data))
+                    blocks[i] = (rect, text, data)
+                continue
+            y1 = self.slot_y(i)
+            rect = canvas.create_rectangle(x1, y1, x2, y1 + self.FRAME_H,
+                                           fill=theme["node_fill"], outline=theme["node_border"], width=1, tags="node")
+            text = canvas.create_text(x1 + self.FRAME_W / 2, y1 + self.FRAME_H / 2, text=str(data),
+                                      anchor="center", fill=theme["btn_fg"], font=("Arial", 10, "bold"), tags="node_text")
+            blocks.append((rect, text, data))
+
+        top = size - 1
+        if top != old_top:
+            if 0 <= old_top < size:
+                canvas.itemconfig(blocks[old_top][0], fill=theme["node_fill"], tags="node")
+            if size:
+                canvas.itemconfig(blocks[top][0], fill=theme["accent"], tags="top_node")
+                canvas.coords(self.top_marker, x2 + 10, self.slot_y(top) + self.FRAME_H / 2)
+        canvas.itemconfig(self.top_marker, state="normal" if size else "hidden")
+        self.scroll_to_slot(max(top, 0))
+
+    def create_stack_frame(self, theme):
+        """Creates the items that live for the page's lifetime: header, empty notice and TOP marker."""
+        canvas = self.canvas
+        self.header = canvas.create_text(self.X_START, 10, text="", anchor="nw", fill=theme["fg"], font=("Arial", 10), tags="text")
+        bottom_y = self.slot_y(0) + self.FRAME_H / 2
+        self.empty_text = canvas.create_text(self.X_START, bottom_y, text="The Stack is Empty.",
+                                             anchor="w", fill=theme["fg"], font=("Arial", 12), tags="text")
+        self.top_marker = canvas.create_text(self.X_START + self.FRAME_W + 10, bottom_y, text="<-- TOP / PEEK",
+                                             anchor="w", fill=theme["head_color"], font=("Arial", 10, "bold"), tags="head")
+        # The slots are fixed, so the scroll region is known without asking Tk for bbox("all").
+        self.scroll_height = self.slot_y(-1) + 50
+        canvas.config(scrollregion=(0, 0, self.X_START + self.FRAME_W + 150, self.scroll_height))
+
+    def scroll_to_slot(self, position):
+        """Scrolls just far enough to show the block at `position`."""
+        y1 = self.slot_y(position)
+        view_top = self.canvas.canvasy(0)
+        view_bottom = view_top + self.canvas.winfo_height()
+        if y1 < view_top or y1 + self.FRAME_H > view_bottom:
+            self.canvas.yview_moveto(max(0.0, y1 + self.FRAME_H - self.canvas.winfo_height() / 2) / self.scroll_height)
 
     def _validate_numeric_input(self, P):
         """Validates that the input is a digit or an empty string."""